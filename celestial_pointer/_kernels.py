@@ -0,0 +1,213 @@
+"""
+Compiled coordinate kernels for the Celestial Pointer project.
+
+The kernels are JIT-compiled with numba when it is installed and otherwise
+run as plain Python, except the array kernel, which uses ERFA's vectorized
+routines when pyerfa is available. radec_to_azel_gpu runs the array conversion
+on a CUDA device and needs cupy and a usable device (see gpu_available).
+"""
+
+import math
+
+try:
+    from numba import njit, prange
+    numba_available = True
+except ImportError:
+    # numba is optional; without it the kernels below run as plain Python
+    numba_available = False
+    
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+    
+    prange = range
+
+import numpy as np
+
+try:
+    import erfa
+except ImportError:
+    # pyerfa is optional; it only replaces the array kernel when numba is missing
+    erfa = None
+
+# cupy is optional and imported on first use (see gpu_available), so CPU-only runs
+# never pay its import cost
+_cupy = None
+_gpu_checked = False
+
+
+# Angle conversion factors (plain multiplies; also folded in as constants by numba)
+DEG2RAD = math.pi / 180.0
+RAD2DEG = 180.0 / math.pi
+HOURS2RAD = math.pi / 12.0
+
+
+@njit(cache=True, fastmath=True)
+def radec_to_azel(ra_hours, dec_degrees, sin_lat, cos_lat, lst_hours):
+    """
+    Convert RA/Dec to azimuth/elevation for an observer (compiled when numba is available).
+    
+    Args:
+        ra_hours: Right ascension in hours
+        dec_degrees: Declination in degrees
+        sin_lat: Sine of the observer latitude
+        cos_lat: Cosine of the observer latitude
+        lst_hours: Local sidereal time in hours
+        
+    Returns:
+        tuple: (azimuth_degrees, elevation_degrees)
+    """
+    dec_rad = dec_degrees * DEG2RAD
+    
+    # Hour angle
+    ha_rad = (lst_hours - ra_hours) * HOURS2RAD
+    
+    sin_dec, cos_dec = math.sin(dec_rad), math.cos(dec_rad)
+    cos_ha = math.cos(ha_rad)
+    
+    # Calculate elevation (altitude)
+    sin_elevation = sin_lat * sin_dec + cos_lat * cos_dec * cos_ha
+    elevation = math.asin(max(-1.0, min(1.0, sin_elevation))) * RAD2DEG
+    
+    # Calculate azimuth (atan2 resolves the quadrant, measured from north through east)
+    azimuth = (math.atan2(-math.sin(ha_rad) * cos_dec,
+                          cos_lat * sin_dec - sin_lat * cos_dec * cos_ha) * RAD2DEG) % 360.0
+    
+    return azimuth, elevation
+
+
+if numba_available or erfa is None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def radec_to_azel_batch(ra_rad, dec_rad, lst_rad, sin_lat, cos_lat, out_az, out_el):
+        """
+        Convert arrays of RA/Dec to azimuth/elevation in one fused loop (parallel when numba is available).
+        
+        Args:
+            ra_rad: Right ascensions in radians
+            dec_rad: Declinations in radians
+            lst_rad: Local sidereal time in radians
+            sin_lat: Sine of the observer latitude
+            cos_lat: Cosine of the observer latitude
+            out_az: Output array for azimuths in degrees
+            out_el: Output array for elevations in degrees
+        """
+        for i in prange(ra_rad.size):
+            ha_rad = lst_rad - ra_rad[i]
+            sin_dec, cos_dec = math.sin(dec_rad[i]), math.cos(dec_rad[i])
+            cos_ha = math.cos(ha_rad)
+            
+            sin_elevation = sin_lat * sin_dec + cos_lat * cos_dec * cos_ha
+            out_el[i] = math.asin(max(-1.0, min(1.0, sin_elevation))) * RAD2DEG
+            out_az[i] = (math.atan2(-math.sin(ha_rad) * cos_dec,
+                                    cos_lat * sin_dec - sin_lat * cos_dec * cos_ha) * RAD2DEG) % 360.0
+else:
+    def radec_to_azel_batch(ra_rad, dec_rad, lst_rad, sin_lat, cos_lat, out_az, out_el):
+        """
+        Convert arrays of RA/Dec to azimuth/elevation with ERFA's vectorized hd2ae.
+        
+        Used instead of the loop kernel when numba is not installed; same arguments.
+        """
+        azimuths, elevations = erfa.hd2ae(lst_rad - ra_rad, dec_rad, math.atan2(sin_lat, cos_lat))
+        np.multiply(azimuths, RAD2DEG, out=out_az)
+        np.multiply(elevations, RAD2DEG, out=out_el)
+
+
+if numba_available or erfa is None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def radec_to_azel_grid(ra_rad, dec_rad, lst_rad, sin_lat, cos_lat, out_az, out_el):
+        """
+        Convert RA/Dec targets to azimuth/elevation at many sidereal times (times x targets).
+        
+        Args:
+            ra_rad: Right ascensions in radians, shape (n_targets,)
+            dec_rad: Declinations in radians, shape (n_targets,)
+            lst_rad: Local sidereal times in radians, shape (n_times,)
+            sin_lat: Sine of the observer latitude
+            cos_lat: Cosine of the observer latitude
+            out_az: Output array for azimuths in degrees, shape (n_times, n_targets)
+            out_el: Output array for elevations in degrees, shape (n_times, n_targets)
+        """
+        for i in prange(lst_rad.size):
+            for j in range(ra_rad.size):
+                ha_rad = lst_rad[i] - ra_rad[j]
+                sin_dec, cos_dec = math.sin(dec_rad[j]), math.cos(dec_rad[j])
+                cos_ha = math.cos(ha_rad)
+                
+                sin_elevation = sin_lat * sin_dec + cos_lat * cos_dec * cos_ha
+                out_el[i, j] = math.asin(max(-1.0, min(1.0, sin_elevation))) * RAD2DEG
+                out_az[i, j] = (math.atan2(-math.sin(ha_rad) * cos_dec,
+                                           cos_lat * sin_dec - sin_lat * cos_dec * cos_ha) * RAD2DEG) % 360.0
+else:
+    def radec_to_azel_grid(ra_rad, dec_rad, lst_rad, sin_lat, cos_lat, out_az, out_el):
+        """
+        Convert RA/Dec targets to azimuth/elevation at many sidereal times with ERFA's hd2ae.
+        
+        Used instead of the loop kernel when numba is not installed; same arguments.
+        """
+        azimuths, elevations = erfa.hd2ae(lst_rad[:, None] - ra_rad[None, :], dec_rad[None, :],
+                                          math.atan2(sin_lat, cos_lat))
+        np.multiply(azimuths, RAD2DEG, out=out_az)
+        np.multiply(elevations, RAD2DEG, out=out_el)
+
+
+def gpu_available():
+    """
+    Check whether cupy is installed with a usable CUDA device.
+    
+    cupy is imported and the device count queried on the first call only; the
+    answer is reused afterwards.
+    
+    Returns:
+        bool: True if radec_to_azel_gpu can run
+    """
+    global _cupy, _gpu_checked
+    if not _gpu_checked:
+        try:
+            import cupy
+            if cupy.cuda.runtime.getDeviceCount() > 0:
+                _cupy = cupy
+        except Exception:
+            # Not installed, or installed without a working CUDA driver/device
+            _cupy = None
+        _gpu_checked = True
+    return _cupy is not None
+
+
+def radec_to_azel_gpu(ra_rad, dec_rad, lst_rad, sin_lat, cos_lat):
+    """
+    Convert arrays of RA/Dec to azimuth/elevation on the GPU (requires gpu_available()).
+    
+    Args:
+        ra_rad: Right ascensions in radians
+        dec_rad: Declinations in radians
+        lst_rad: Local sidereal time in radians
+        sin_lat: Sine of the observer latitude
+        cos_lat: Cosine of the observer latitude
+        
+    Returns:
+        tuple: (azimuths_degrees, elevations_degrees) as NumPy arrays
+    """
+    cp = _cupy
+    ha_rad = lst_rad - cp.asarray(ra_rad)
+    dec_rad = cp.asarray(dec_rad)
+    sin_dec, cos_dec = cp.sin(dec_rad), cp.cos(dec_rad)
+    cos_ha = cp.cos(ha_rad)
+    
+    sin_elevation = sin_lat * sin_dec + cos_lat * cos_dec * cos_ha
+    elevations = cp.arcsin(cp.clip(sin_elevation, -1.0, 1.0)) * RAD2DEG
+    azimuths = (cp.arctan2(-cp.sin(ha_rad) * cos_dec,
+                           cos_lat * sin_dec - sin_lat * cos_dec * cos_ha) * RAD2DEG) % 360.0
+    return cp.asnumpy(azimuths), cp.asnumpy(elevations)
+
+
+def warm_up_kernels():
+    """
+    Run each kernel once on dummy inputs.
+    
+    Compiling (or loading the on-disk numba cache) happens on first call; doing it
+    here keeps that cost out of the first real position request.
+    """
+    radec_to_azel(0.0, 0.0, 0.0, 1.0, 0.0)
+    radec_to_azel_batch(np.zeros(1), np.zeros(1), 0.0, 0.0, 1.0, np.empty(1), np.empty(1))
+    radec_to_azel_grid(np.zeros(1), np.zeros(1), np.zeros(1), 0.0, 1.0, np.empty((1, 1)), np.empty((1, 1)))
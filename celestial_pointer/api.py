@@ -738,26 +738,26 @@ def get_preloaded_satellites(format: Optional[str] = Query(None, description="Ou
     if target_calculator is None:
         raise HTTPException(status_code=500, detail="Target calculator not initialized")
     
-    satellites = target_calculator.get_preloaded_satellites()
+    satellites = target_calculator.get_preloaded_satellites_array()
     
-    # Format response with visibility information
+    # Format response with visibility information (rows are built only here, for the JSON response)
     result = {
         "count": len(satellites),
         "satellites": [
             {
-                "name": sat["name"],
-                "norad_id": sat["norad_id"],
-                "elevation": round(sat["elevation"], 2) if sat["elevation"] is not None else None,
-                "azimuth": round(sat["azimuth"], 2) if sat["azimuth"] is not None else None,
-                "visible": sat["elevation"] is not None and sat["elevation"] > 0,
+                "name": name,
+                "norad_id": norad_id,
+                "elevation": round(elevation, 2),
+                "azimuth": round(azimuth, 2),
+                "visible": elevation > 0,
                 "endpoint": "/target/satellite",
                 "method": "POST",
                 "payload": {
-                    "satellite_id": sat["id"]
+                    "satellite_id": norad_id
                 },
-                "example_curl": f'curl -X POST http://localhost:8000/target/satellite -H "Content-Type: application/json" -d \'{{"satellite_id": "{sat["id"]}"}}\''
+                "example_curl": f'curl -X POST http://localhost:8000/target/satellite -H "Content-Type: application/json" -d \'{{"satellite_id": "{norad_id}"}}\''
             }
-            for sat in satellites
+            for name, norad_id, elevation, azimuth in satellites.tolist()
         ]
     }
     
@@ -43,6 +43,7 @@ GEAR_RATIO = MOTOR2_GEAR_RATIO
 # Motor Control Settings
 MOTOR_STEP_TYPE = "half"  # "full", "half", "wave"
 MOTOR_DEFAULT_DELAY = 0.001  # seconds between steps
+MOTOR1_MAX_PENDING_STEPS = 128  # Max steps coalesced onto an in-flight motor 1 move (bounds added latency)
 
 # Laser Range Limits (in degrees from IMU plane)
 LASER_MAX_ELEVATION = 90.0  # Directly up (degrees)
@@ -9,7 +9,7 @@ from RpiMotorLib import RpiMotorLib
 from .config import (
     MOTOR1_PINS, MOTOR2_PINS, MOTOR_STEP_TYPE, MOTOR_DEFAULT_DELAY,
     MOTOR_STEPS_PER_REVOLUTION, MOTOR_DEGREES_PER_STEP, 
-    MOTOR1_GEAR_RATIO, MOTOR2_GEAR_RATIO,
+    MOTOR1_GEAR_RATIO, MOTOR2_GEAR_RATIO, MOTOR1_MAX_PENDING_STEPS,
     LASER_MAX_ELEVATION, LASER_MIN_ELEVATION, MOTOR2_GEAR_OFFSET_STEPS
 )
 
@@ -25,6 +25,13 @@ class MotorController:
         self.motor1 = RpiMotorLib.BYJMotor("Motor1", "28BYJ")
         self.motor2 = RpiMotorLib.BYJMotor("Motor2", "28BYJ")
 
+        # Config snapshots (avoid module-global lookups on every move)
+        self._default_delay = MOTOR_DEFAULT_DELAY
+        self._step_type = MOTOR_STEP_TYPE
+        self._m1_pins = MOTOR1_PINS
+        self._m2_pins = MOTOR2_PINS
+        self._m1_max_pending_steps = MOTOR1_MAX_PENDING_STEPS
+
         # Motor state
         self.motor1_position = 0  # Steps from home (0 = home position) - used for movement only
         self.motor2_position = 0  # Steps from calibration (0 = 90 degrees relative to horizon)
@@ -37,6 +44,14 @@ class MotorController:
         self.motor1_moving_until = 0.0  # Timestamp when motor1 movement will complete
         self.motor2_moving_until = 0.0  # Timestamp when motor2 movement will complete
         
+        # Motor 1 move coalescing: small same-direction moves that arrive while a move
+        # is in flight are added to the pending count and run as a follow-on move
+        self._motor1_pending_lock = threading.Lock()
+        self._motor1_pending_steps = 0  # Physical steps to run next (direction comes from clockwise)
+        self._motor1_pending_delta = 0  # Signed position change of those steps, as passed by callers
+        self._motor1_coalesced_steps = 0  # Total steps coalesced onto the in-flight move (capped)
+        self._motor1_pending_dir = None  # Direction (clockwise) of the in-flight move, None when idle
+        
         # Calculate degrees per step accounting for gear ratios
         # Base: 512 steps = 360 degrees (external motor shaft)
         # Motor 1: Apply gear ratio for case rotation
@@ -56,13 +71,30 @@ class MotorController:
         """
         Move motor 1 (base rotation).
         
+        If a move in the same direction is already in flight, the steps are added to it
+        and this call returns without waiting; the follow-on steps run at the in-flight
+        move's delay. At most MOTOR1_MAX_PENDING_STEPS are coalesced onto one move in
+        total, so a stream of small moves cannot hold the motor lock indefinitely.
+        If a follow-on run fails, its steps are dropped even though the calls that
+        queued them have already returned successfully.
+        
         Args:
             steps: Number of steps to move
             delay: Delay between steps (seconds). If None, uses default.
             clockwise: True for clockwise, False for counterclockwise
         """
         if delay is None:
-            delay = MOTOR_DEFAULT_DELAY
+            delay = self._default_delay
+
+        # Coalesce onto the in-flight move if it is going the same direction
+        with self._motor1_pending_lock:
+            if (self._motor1_pending_dir == clockwise and
+                    self._motor1_coalesced_steps + abs(steps) <= self._m1_max_pending_steps):
+                self._motor1_pending_steps += abs(steps)
+                self._motor1_pending_delta += steps
+                self._motor1_coalesced_steps += abs(steps)
+                self.motor1_moving_until += abs(steps) * delay * 1.1
+                return
 
         # Calculate estimated movement time
         estimated_time = abs(steps) * delay
@@ -72,24 +104,42 @@ class MotorController:
             try:
                 # Update movement tracking
                 self.motor1_moving_until = movement_end_time
+                with self._motor1_pending_lock:
+                    self._motor1_pending_dir = clockwise
+                    self._motor1_coalesced_steps = 0
                 
-                self.motor1.motor_run(
-                    MOTOR1_PINS,
-                    delay,
-                    abs(steps),
-                    clockwise,
-                    False,  # verbose
-                    MOTOR_STEP_TYPE,
-                    0.0  # init_delay
-                )
+                run_steps, position_delta = abs(steps), steps
+                while True:
+                    self.motor1.motor_run(
+                        self._m1_pins,
+                        delay,
+                        run_steps,
+                        clockwise,
+                        False,  # verbose
+                        self._step_type,
+                        0.0  # init_delay
+                    )
 
-                self.motor1_position += steps
+                    self.motor1_position += position_delta
+                    
+                    # Pick up any steps coalesced while the driver was running
+                    with self._motor1_pending_lock:
+                        run_steps, position_delta = self._motor1_pending_steps, self._motor1_pending_delta
+                        self._motor1_pending_steps = 0
+                        self._motor1_pending_delta = 0
+                        if run_steps == 0:
+                            self._motor1_pending_dir = None
+                            break
                 
                 # Clear movement tracking (movement complete)
                 self.motor1_moving_until = 0.0
 
             except Exception as e:
-                # Clear movement tracking on error
+                # Clear movement tracking and drop coalesced steps on error
+                with self._motor1_pending_lock:
+                    self._motor1_pending_steps = 0
+                    self._motor1_pending_delta = 0
+                    self._motor1_pending_dir = None
                 self.motor1_moving_until = 0.0
                 raise RuntimeError(f"Motor 1 movement failed: {e}")
     
@@ -103,7 +153,7 @@ class MotorController:
             clockwise: True for clockwise, False for counterclockwise
         """
         if delay is None:
-            delay = MOTOR_DEFAULT_DELAY
+            delay = self._default_delay
 
         # Calculate estimated movement time
         estimated_time = abs(steps) * delay
@@ -115,12 +165,12 @@ class MotorController:
                 self.motor2_moving_until = movement_end_time
                 
                 self.motor2.motor_run(
-                    MOTOR2_PINS,
+                    self._m2_pins,
                     delay,
                     abs(steps),
                     clockwise,
                     False,  # verbose
-                    MOTOR_STEP_TYPE,
+                    self._step_type,
                     0.0  # init_delay
                 )
                 # Update position (forward = increase Z angle = counterclockwise = not clockwise)
@@ -148,9 +198,9 @@ class MotorController:
             step_type: Step type ("full", "half", "wave"). If None, uses default.
         """
         if delay is None:
-            delay = MOTOR_DEFAULT_DELAY
+            delay = self._default_delay
         if step_type is None:
-            step_type = MOTOR_STEP_TYPE
+            step_type = self._step_type
         
         # Don't do anything if steps is 0
         if steps == 0:
@@ -163,7 +213,7 @@ class MotorController:
                 print(f"DEBUG Calibration: Moving {abs(steps)} steps, clockwise={clockwise}, old_position={old_position}")
                 
                 self.motor2.motor_run(
-                    MOTOR2_PINS,
+                    self._m2_pins,
                     delay,
                     abs(steps),
                     clockwise,
@@ -189,7 +239,7 @@ class MotorController:
         """
 
         if delay is None:
-            delay = MOTOR_DEFAULT_DELAY
+            delay = self._default_delay
 
         steps = int(degrees / self.motor1_degrees_per_step)
 
@@ -207,7 +257,7 @@ class MotorController:
             skip_bounds_check: Unused parameter (kept for backward compatibility)
         """
         if delay is None:
-            delay = MOTOR_DEFAULT_DELAY
+            delay = self._default_delay
             
         steps = int(degrees / self.motor2_degrees_per_step) 
 
@@ -215,14 +265,22 @@ class MotorController:
         self.move_motor2(steps, delay, clockwise)
     
     def get_motor1_position(self):
-        """Get current motor 1 position in steps."""
-        with self.lock:
-            return self.motor1_position
+        """
+        Get current motor 1 position in steps.
+        
+        Reads without taking the motor lock so polling doesn't stall behind a move.
+        While a move is in progress this is the count from before that move.
+        """
+        return self.motor1_position
     
     def get_motor2_position(self):
-        """Get current motor 2 position in steps."""
-        with self.lock:
-            return self.motor2_position
+        """
+        Get current motor 2 position in steps.
+        
+        Reads without taking the motor lock so polling doesn't stall behind a move.
+        While a move is in progress this is the count from before that move.
+        """
+        return self.motor2_position
     
     def get_motor1_angle(self):
         """
@@ -251,6 +309,27 @@ class MotorController:
         """Check if either motor is currently moving."""
         return self.is_motor1_moving() or self.is_motor2_moving()
     
+    def wait_until_idle(self, timeout=None):
+        """
+        Block until no move is in progress (including coalesced follow-on steps).
+        
+        Args:
+            timeout: Maximum seconds to wait. If None, waits indefinitely.
+            
+        Returns:
+            bool: True if the motors are idle, False if the timeout expired
+        """
+        if not self.lock.acquire(timeout=-1 if timeout is None else timeout):
+            return False
+        self.lock.release()
+        return True
+    
+    def _run_in_background(self, func):
+        """Start func on a daemon worker thread and return the thread."""
+        worker = threading.Thread(target=func, daemon=True)
+        worker.start()
+        return worker
+    
     def reset_motor1_position(self):
         """Reset motor 1 position counter to 0."""
         with self.lock:
@@ -411,9 +490,10 @@ class MotorController:
             else:
                 # Step 1: Move laser down 90 degrees from calibration position
                 print("\nStep 1: Moving laser down 90 degrees...")
-                laser_controller.turn_off()
+                laser_off = self._run_in_background(laser_controller.turn_off)
                 self.move_motor2_degrees(90.0, clockwise=None, skip_bounds_check=True)
-                time.sleep(0.5)
+                laser_off.join()
+                self.wait_until_idle()
                 print("✓ Laser moved down 90 degrees")
                 
                 # Step 2: Turn on laser
@@ -425,7 +505,7 @@ class MotorController:
                 print("\nStep 3: Mark your reference point on the wall.")
                 print("Position the laser where you want to mark, then press Enter to continue...")
                 input()
-                laser_controller.turn_off()
+                laser_off = self._run_in_background(laser_controller.turn_off)
                 
                 # Step 4: Reset motor 1 position to 0 (this is the reference position)
                 print("\nStep 4: Setting motor 1 home position to 0...")
@@ -436,7 +516,8 @@ class MotorController:
                 print("\nStep 5: Rotating motor 1 by 360 degrees...")
                 print("Watch the laser - it should return to your mark when the rotation completes.")
                 self.move_motor1_degrees(360.0, clockwise=None)
-                time.sleep(0.5)
+                laser_off.join()
+                self.wait_until_idle()
                 print("✓ 360 degree rotation complete")
 
                 laser_controller.turn_on()
@@ -448,13 +529,14 @@ class MotorController:
                 
                 # Step 7: Turn off laser
                 print("\nStep 7: Turning off laser...")
-                laser_controller.turn_off()
-                print("✓ Laser is off")
+                laser_off = self._run_in_background(laser_controller.turn_off)
                 
                 # Step 8: Move laser down another 90 degrees (total 180 from home)
                 print("\nStep 8: Moving laser down another 90 degrees (total 180 from home)...")
                 self.move_motor2_degrees(90.0, clockwise=None, skip_bounds_check=True)
-                time.sleep(0.5)
+                laser_off.join()
+                print("✓ Laser is off")
+                self.wait_until_idle()
                 print("✓ Laser moved down to 180 degrees from home")
                 
                 print("\n✓ Motor 1 calibration complete!")
@@ -472,8 +554,8 @@ class MotorController:
         start_motor2_steps = self.get_motor2_position()
         
         
-        # Wait a moment for movement to complete
-        time.sleep(0.5)
+        # Wait for any in-flight movement to complete
+        self.wait_until_idle()
         
         print("\n" + "=" * 60)
     
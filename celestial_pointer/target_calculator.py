@@ -3,24 +3,130 @@ Target calculator for astronomical objects, satellites, and planes.
 Uses Skyfield for accurate astronomical calculations.
 """
 
+import lzma
 import math
-from datetime import datetime
+import os
+import pickle
+import threading
+from time import monotonic, time as posix_time
+from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Dict, Optional, Tuple, List, Any
 import warnings
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from sgp4.api import Satrec, SatrecArray, jday
 from skyfield.api import wgs84
 from skyfield.api import load, Topos, Loader, Star, EarthSatellite
-from skyfield.data import hipparcos
-import requests
+from skyfield.sgp4lib import theta_GMST1982
 
+from ._kernels import (DEG2RAD, RAD2DEG, HOURS2RAD, gpu_available, radec_to_azel, radec_to_azel_batch,
+                       radec_to_azel_gpu, radec_to_azel_grid, warm_up_kernels)
 
 
 # Suppress skyfield warnings about ephemeris files
 warnings.filterwarnings('ignore', category=DeprecationWarning)
 
+# Compressed (hip_ids, ra/dec) arrays extracted from the Hipparcos catalog,
+# stored next to the other Skyfield data files
+HIPPARCOS_CACHE_FILENAME = 'hip_cache.pkl.xz'
+
+# "Now" is reused for this long, so rapid polling shares one Skyfield Time
+CURRENT_TIME_CACHE_SECONDS = 0.1
+
+# Julian Day of the Unix epoch (1970-01-01T00:00:00 UTC)
+UNIX_EPOCH_JD = 2440587.5
+
+# GMST is tabulated on this grid and interpolated linearly (it is linear in time apart
+# from century-scale terms, so the interpolation error is negligible)
+GMST_TABLE_STEP_DAYS = 1.0 / 1440.0
+GMST_TABLE_SPAN_DAYS = 2.0
+
+# Array conversions at least this large run on the GPU when cupy and a CUDA device are
+# available (below it, the transfer overhead outweighs the faster trig)
+GPU_BATCH_THRESHOLD = 50000
+
+# Row layout of get_preloaded_satellites_array()
+SATELLITE_DTYPE = np.dtype([('name', 'U32'), ('norad_id', 'U16'), ('elevation', 'f8'), ('azimuth', 'f8')])
+
+# Bright stars with RA (hours) and Dec (degrees), used when the Hipparcos catalog is unavailable
+BRIGHT_STARS = {
+    "sirius": (6.752, -16.716),
+    "polaris": (2.530, 89.264),
+    "vega": (18.615, 38.784),
+    "arcturus": (14.261, 19.182),
+    "capella": (5.278, 45.998),
+    "rigel": (5.242, -8.201),
+    "betelgeuse": (5.919, 7.407),
+    "altair": (19.846, 8.868),
+    "spica": (13.420, -11.161),
+    "antares": (16.490, -26.432),
+    "deneb": (20.690, 45.280),
+    "fomalhaut": (22.961, -29.622),
+    "regulus": (10.140, 11.967),
+    "castor": (7.577, 31.888),
+    "pollux": (7.755, 28.026),
+}
+
+# Downloaded TLE files are reused from the Skyfield data directory until they are this old
+TLE_CACHE_MAX_AGE_SECONDS = 86400.0
+
+
+def _parse_tle_text(text: str) -> List[Tuple[str, str, str, str]]:
+    """
+    Split 3-line TLE text into satellite entries.
+    
+    TLE lines are fixed-column, so the NORAD ID is read straight from columns 3-7
+    of line 1 instead of tokenizing the line.
+    
+    Args:
+        text: TLE text (name line, line 1, line 2, repeating)
+        
+    Returns:
+        list: (norad_id, name, line1, line2) tuples
+    """
+    lines = [line.strip() for line in text.splitlines()]
+    entries = []
+    for i in range(1, len(lines) - 1):
+        line1 = lines[i]
+        if line1.startswith('1 ') and lines[i + 1].startswith('2 ') and len(line1) >= 7:
+            entries.append((line1[2:7].strip(), lines[i - 1], line1, lines[i + 1]))
+    return entries
+
+
+def _gmst_degrees(jd):
+    """
+    Greenwich Mean Sidereal Time from the IAU polynomial, not reduced modulo 360.
+    
+    Works on floats and NumPy arrays alike; the unwrapped angle increases monotonically
+    with time, so it can be interpolated linearly.
+    
+    Args:
+        jd: Julian Day(s) (UT)
+        
+    Returns:
+        GMST in degrees
+    """
+    days = jd - 2451545.0
+    t = days / 36525.0
+    return 280.46061837 + 360.98564736629 * days + 0.000387933 * t * t - t * t * t / 38710000.0
+
 
 class TargetCalculator:
     """Calculates target positions for various objects using Skyfield."""
     
+    # Fixed attribute layout: faster attribute access and no per-instance __dict__
+    __slots__ = (
+        'latitude', 'longitude', 'altitude', 'load_star_chart',
+        '_lat_rad', '_lon_rad', '_sin_lat', '_cos_lat', '_gmst_grid',
+        'ts', 'eph', 'loader', 'skyfield_available',
+        'observer_topos', 'observer_wgs84', '_observer_itrf_xyz', '_observer_rotation_ecef_to_enu',
+        '_star_names', '_star_ra', '_star_dec',
+        'stars_loaded', '_hip_lookup', '_star_cache', '_star_catalog_load_attempted',
+        '_last_time_cache', '_altaz_cache', '_star_position_cache', 'satellites', '_satrecs', '_satellite_index',
+        '_satellite_index_lock', '_name_to_norad', '_satellite_tokens', '_http_session',
+    )
+    
     def __init__(self, latitude: float, longitude: float, altitude: float = 0.0, load_star_chart: bool = True):
         """
         Initialize target calculator.
@@ -35,6 +141,29 @@ class TargetCalculator:
         self.longitude = longitude
         self.altitude = altitude
         self.load_star_chart = load_star_chart
+        self._update_observer_cache()
+        
+        # GMST lookup table around the current time (rebuilt if queries move outside it)
+        now_jd = self._now_jd()
+        self._gmst_table(now_jd - GMST_TABLE_SPAN_DAYS / 2, now_jd + GMST_TABLE_SPAN_DAYS / 2)
+        
+        # Compile/load the coordinate kernels now rather than on the first position request
+        warm_up_kernels()
+        
+        # Bright-star catalog as parallel arrays: lowercased name -> row in _star_ra/_star_dec.
+        # float32 holds the catalog's precision (well under an arcsecond); the conversions
+        # promote to float64 as they scale to radians, so time/LST precision is unaffected
+        self._star_names = {name: i for i, name in enumerate(BRIGHT_STARS)}
+        self._star_ra = np.array([ra for ra, _ in BRIGHT_STARS.values()], dtype=np.float32)
+        self._star_dec = np.array([dec for _, dec in BRIGHT_STARS.values()], dtype=np.float32)
+        
+        self._last_time_cache = (0.0, None)  # (monotonic timestamp, Skyfield Time)
+        self._satellite_index_lock = threading.Lock()
+        # Per-instance LRU of single-satellite positions keyed on (norad_id, centiseconds);
+        # cleared whenever the observer or the loaded TLEs change
+        self._altaz_cache = lru_cache(maxsize=2048)(self._satellite_altaz_at)
+        # Likewise for stars, keyed on (star_name, whole seconds)
+        self._star_position_cache = lru_cache(maxsize=4096)(self._star_position_at)
         
         # Initialize Skyfield
         self._init_skyfield()
@@ -50,29 +179,40 @@ class TargetCalculator:
             self.eph = load('de421.bsp')  # Planetary ephemeris
             self.loader = Loader('~/.skyfield-data/')
             
+            # Shared HTTP session, created on first Celestrak request (see _get_http_session)
+            self._http_session = None
+            
             # Create observer location
             self._update_observer_location()
             
 
             
             # Load star catalog (Hipparcos catalog) if enabled
+            self._hip_lookup: Dict[int, Tuple[float, float]] = {}  # HIP number -> (RA hours, Dec degrees)
+            self._star_catalog_load_attempted = self.load_star_chart
+            self._star_cache: Dict[Any, Star] = {}  # HIP number or fallback star name -> Star
             if self.load_star_chart:
                 try:
-                    with self.loader.open(hipparcos.URL) as f:
-                        self.star_catalog = hipparcos.load_dataframe(f)
+                    self._load_star_catalog()
                     self.stars_loaded = True
                     print("Star catalog loaded successfully.")
                 except Exception as e:
                     print(f"Warning: Could not load star catalog: {e}")
                     self.stars_loaded = False
-                    self.star_catalog = None
             else:
                 print("Star chart loading disabled (LOAD_STAR_CHART=False).")
                 self.stars_loaded = False
-                self.star_catalog = None
             
             # Satellite TLE data (will be loaded on demand)
-            self.satellites = {}
+            self.satellites: Dict[str, EarthSatellite] = {}  # Keyed by NORAD ID only
+            self._satrecs: Dict[str, Satrec] = {}  # NORAD ID -> SGP4 record, for batched propagation
+            # (NORAD IDs, SatrecArray over _satrecs in the same order), rebuilt after each load and
+            # published as one tuple so readers never pair one load's IDs with another's array
+            self._satellite_index: Tuple[List[str], Optional[SatrecArray]] = ([], None)
+            self._name_to_norad: Dict[str, str] = {}  # Uppercased name -> NORAD ID
+            # Uppercased name word -> uppercased names (a dict used as an insertion-ordered set,
+            # so matches come back in load order)
+            self._satellite_tokens: Dict[str, Dict[str, None]] = {}
             self.skyfield_available = True
             
         except Exception as e:
@@ -80,12 +220,71 @@ class TargetCalculator:
             self.skyfield_available = False
             self.ts = None
             self.eph = None
-            self.observer = None
+            self.observer_wgs84 = None
             self.stars_loaded = False
-            self.star_catalog = None
+            self._hip_lookup = {}
+            self._star_catalog_load_attempted = True
+            self._star_cache = {}
+            self._http_session = None
             self.satellites = {}
+            self._satrecs = {}
+            self._satellite_index = ([], None)
+            self._name_to_norad = {}
+            self._satellite_tokens = {}
 
 
+    def _load_star_catalog(self):
+        """
+        Load Hipparcos star positions (internal method).
+        
+        The first load parses the full catalog and writes the HIP ids and RA/Dec
+        columns to an LZMA-compressed pickle; later loads read that cache instead.
+        An unreadable cache (e.g. left truncated by an interrupted write) is rebuilt.
+        """
+        cache_path = self.loader.path_to(HIPPARCOS_CACHE_FILENAME)
+        hip_ids = None
+        if os.path.exists(cache_path):
+            try:
+                with lzma.open(cache_path, 'rb') as f:
+                    hip_ids, hip_radec = pickle.loads(f.read())
+            except Exception as e:
+                print(f"Warning: Could not read star catalog cache, rebuilding it: {e}")
+                hip_ids = None
+        
+        if hip_ids is None:
+            from skyfield.data import hipparcos
+            
+            with self.loader.open(hipparcos.URL) as f:
+                df = hipparcos.load_dataframe(f)
+            df = df[df['ra_degrees'].notnull() & df['dec_degrees'].notnull()]
+            hip_ids = np.array(df.index, dtype=np.int32)
+            hip_radec = np.stack([df['ra_degrees'].values, df['dec_degrees'].values]).astype(np.float32)
+            
+            # Write to a temporary file and rename it into place, so the cache file is
+            # either complete or absent
+            temp_path = f"{cache_path}.{os.getpid()}.tmp"
+            try:
+                with lzma.open(temp_path, 'wb') as f:
+                    pickle.dump((hip_ids, hip_radec), f)
+                os.replace(temp_path, cache_path)
+            except OSError as e:
+                print(f"Warning: Could not write star catalog cache: {e}")
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
+        
+        # Plain-float lookup table so each query is a single dict hit (hip_radec row 0: RA, row 1: Dec)
+        self._hip_lookup = dict(zip(hip_ids.tolist(),
+                                    zip((hip_radec[0] / 15.0).tolist(), hip_radec[1].tolist())))
+    
+    def _update_observer_cache(self):
+        """Precompute the observer's latitude/longitude trig terms (internal method)."""
+        self._lat_rad = self.latitude * DEG2RAD
+        self._lon_rad = self.longitude * DEG2RAD
+        self._sin_lat = math.sin(self._lat_rad)
+        self._cos_lat = math.cos(self._lat_rad)
+    
     def _update_observer_location(self):
         """Update the observer location (internal method)."""
         
@@ -97,6 +296,18 @@ class TargetCalculator:
                 longitude_degrees=self.longitude,
                 elevation_m=self.altitude
             )
+            
+            # Earth-fixed observer position (km) and Earth-fixed -> East/North/Up rotation,
+            # shared by every batched satellite calculation
+            self._observer_itrf_xyz = wgs84.latlon(self.latitude, self.longitude,
+                                                   elevation_m=self.altitude).itrs_xyz.km
+            sin_lat, cos_lat = self._sin_lat, self._cos_lat
+            sin_lon, cos_lon = math.sin(self._lon_rad), math.cos(self._lon_rad)
+            self._observer_rotation_ecef_to_enu = np.array([
+                [-sin_lon, cos_lon, 0.0],
+                [-sin_lat * cos_lon, -sin_lat * sin_lon, cos_lat],
+                [cos_lat * cos_lon, cos_lat * sin_lon, sin_lat],
+            ])
 
             earth = self.eph['earth']
             self.observer_wgs84 = earth + wgs84.latlon(self.latitude, self.longitude, elevation_m=self.altitude)
@@ -118,7 +329,24 @@ class TargetCalculator:
             self.altitude = altitude
         
         # Reinitialize observer location
+        self._update_observer_cache()
         self._update_observer_location()
+        self._altaz_cache.cache_clear()
+        self._star_position_cache.cache_clear()
+    
+    def _current_time(self):
+        """
+        Get the current time as a Skyfield Time, reusing it for rapid repeat calls.
+        
+        Returns:
+            Time: Skyfield Time for now (at most CURRENT_TIME_CACHE_SECONDS old)
+        """
+        cached_at, t = self._last_time_cache
+        now = monotonic()
+        if t is None or now - cached_at >= CURRENT_TIME_CACHE_SECONDS:
+            t = self.ts.now()
+            self._last_time_cache = (now, t)
+        return t
     
     def _get_altaz(self, astrometric) -> Tuple[float, float]:
         """
@@ -135,12 +363,12 @@ class TargetCalculator:
         
         try:
             alt, az, distance = astrometric.apparent().altaz()
-            return math.degrees(az.radians), math.degrees(alt.radians)
+            return az.degrees, alt.degrees
         except AttributeError:
             # If astrometric doesn't have apparent(), try altaz() directly
             try:
                 alt, az, distance = astrometric.altaz()
-                return math.degrees(az.radians), math.degrees(alt.radians)
+                return az.degrees, alt.degrees
             except Exception:
                 return None, None
     
@@ -155,6 +383,28 @@ class TargetCalculator:
         Returns:
             tuple: (azimuth_degrees, elevation_degrees) or None if not found
         """
+        # Quantize to whole seconds so repeated queries (e.g. a UI polling loop) hit the position cache
+        if time is None:
+            seconds = round(posix_time())
+        elif time.tzinfo is None:
+            seconds = round(time.replace(tzinfo=timezone.utc).timestamp())
+        else:
+            seconds = round(time.timestamp())
+        return self._star_position_cache(star_name, seconds)
+    
+    def _star_position_at(self, star_name: str, seconds: int) -> Optional[Tuple[float, float]]:
+        """
+        Compute a star's azimuth/elevation (backs self._star_position_cache).
+        
+        Args:
+            star_name: Name of the star or HIP number, as passed to get_star_position
+            seconds: Time as whole seconds since the Unix epoch (UTC)
+            
+        Returns:
+            tuple: (azimuth_degrees, elevation_degrees) or None if not found
+        """
+        time = datetime.fromtimestamp(seconds, tz=timezone.utc)
+        
         # Check if it's a HIP number
         star_input = star_name.strip()
         if star_input.upper().startswith('HIP'):
@@ -175,12 +425,7 @@ class TargetCalculator:
         # Not a HIP number, try by name
         if not self.skyfield_available or not self.stars_loaded:
             # Fallback to simple catalog
-            return self._get_star_position_fallback(star_name)
-        
-        if time is None:
-            t = self.ts.now()
-        else:
-            t = self.ts.from_datetime(time)
+            return self._get_star_position_fallback(star_name, time)
         
         # Common star names mapping to Hipparcos IDs
         # Hipparcos catalog uses HIP numbers, but we can search by name
@@ -216,16 +461,12 @@ class TargetCalculator:
                 except ValueError:
                     pass
             
-            # Try searching catalog by approximate name matching
-            # This is a simplified approach - for production, use a proper star name database
-            star_names_lower = self.star_catalog.index.str.lower() if hasattr(self.star_catalog.index, 'str') else []
-            
             # Fallback to coordinate-based lookup
-            return self._get_star_position_fallback(star_name)
+            return self._get_star_position_fallback(star_name, time)
             
         except Exception as e:
             print(f"Error looking up star {star_name}: {e}")
-            return self._get_star_position_fallback(star_name)
+            return self._get_star_position_fallback(star_name, time)
     
     def get_star_by_hip(self, hip_number: int, time: Optional[datetime] = None) -> Optional[Tuple[float, float]]:
         """
@@ -242,107 +483,111 @@ class TargetCalculator:
             return None
         
         if time is None:
-            t = self.ts.now()
+            t = self._current_time()
         else:
             t = self.ts.from_datetime(time)
         
         try:
+            # Load the catalog on demand (at most once) if it wasn't loaded at startup
+            if not self.stars_loaded and not self._star_catalog_load_attempted:
+                self._star_catalog_load_attempted = True
+                try:
+                    self._load_star_catalog()
+                    self.stars_loaded = True
+                except Exception as e:
+                    print(f"Error loading star catalog: {e}")
+            
             # Try to load from Hipparcos catalog if available
-            if self.stars_loaded and self.star_catalog is not None:
+            if self.stars_loaded:
                 try:
-                    # Look up star in catalog by HIP number
-                    if hip_number in self.star_catalog.index:
-                        star_row = self.star_catalog.loc[hip_number]
-                        # Create star from catalog data using RA and Dec
-                        # The catalog has 'ra_degrees' and 'dec_degrees' columns
-                        # Access DataFrame values correctly
-                        ra_degrees = star_row['ra_degrees'] if 'ra_degrees' in star_row else star_row.get('ra_degrees', 0)
-                        dec_degrees = star_row['dec_degrees'] if 'dec_degrees' in star_row else star_row.get('dec_degrees', 0)
-                        ra_hours = ra_degrees / 15.0  # Convert degrees to hours
-                        
-                        # Create star object
-                        star = Star(ra_hours=ra_hours, dec_degrees=dec_degrees)
+                    # Look up star in catalog by HIP number (Star objects are reused across calls)
+                    star = self._star_cache.get(hip_number)
+                    if star is None:
+                        position = self._hip_lookup.get(hip_number)
+                        if position is not None:
+                            ra_hours, dec_degrees = position
+                            star = Star(ra_hours=ra_hours, dec_degrees=dec_degrees)
+                            self._star_cache[hip_number] = star
+                    
+                    if star is not None:
                         # Observe star from observer location
-                        astrometric = self.observer.at(t).observe(star)
+                        astrometric = self.observer_wgs84.at(t).observe(star)
                         alt, az, distance = astrometric.apparent().altaz()
-                        return math.degrees(az.radians), math.degrees(alt.radians)
+                        return az.degrees, alt.degrees
                 except Exception as e:
                     print(f"Error loading star HIP{hip_number} from catalog: {e}")
             
-            # Fallback: Try loading star catalog directly
-            try:
-
-                # Load catalog on demand
-                with load.open(hipparcos.URL) as f:
-                    df = hipparcos.load_dataframe(f)
-                
-                if hip_number in df.index:
-                    star_row = df.loc[hip_number]
-                    # Extract RA and Dec from catalog
-                    ra_degrees = star_row['ra_degrees'] if 'ra_degrees' in star_row else star_row.get('ra_degrees', 0)
-                    dec_degrees = star_row['dec_degrees'] if 'dec_degrees' in star_row else star_row.get('dec_degrees', 0)
-                    ra_hours = ra_degrees / 15.0  # Convert degrees to hours
-                    
-                    # Create star object
-                    star = Star(ra_hours=ra_hours, dec_degrees=dec_degrees)
-                    # Observe star from observer location
-                    astrometric = self.observer.at(t).observe(star)
-                    alt, az, distance = astrometric.apparent().altaz()
-                    return math.degrees(az.radians), math.degrees(alt.radians)
-            except Exception as e:
-                print(f"Error loading star HIP{hip_number}: {e}")
-            
             return None
             
         except Exception as e:
             print(f"Error calculating star position for HIP{hip_number}: {e}")
             return None
     
-    def _get_star_position_fallback(self, star_name: str) -> Optional[Tuple[float, float]]:
+    def _get_star_position_fallback(self, star_name: str,
+                                    time: Optional[datetime] = None) -> Optional[Tuple[float, float]]:
         """Fallback star position using coordinate lookup."""
         # Star catalog with RA/Dec coordinates
-        star_catalog = {
-            "sirius": (6.752, -16.716),  # RA (hours), Dec (degrees)
-            "polaris": (2.530, 89.264),
-            "vega": (18.615, 38.784),
-            "arcturus": (14.261, 19.182),
-            "capella": (5.278, 45.998),
-            "rigel": (5.242, -8.201),
-            "betelgeuse": (5.919, 7.407),
-            "altair": (19.846, 8.868),
-            "spica": (13.420, -11.161),
-            "antares": (16.490, -26.432),
-            "deneb": (20.690, 45.280),
-            "fomalhaut": (22.961, -29.622),
-            "regulus": (10.140, 11.967),
-            "castor": (7.577, 31.888),
-            "pollux": (7.755, 28.026),
-        }
-        
         star_key = star_name.lower().strip()
-        if star_key not in star_catalog:
+        index = self._star_names.get(star_key)
+        if index is None:
             return None
+        ra_hours, dec_degrees = float(self._star_ra[index]), float(self._star_dec[index])
         
         if not self.skyfield_available:
             # Use manual calculation if skyfield not available
-            return self._calculate_azimuth_elevation_manual(star_catalog[star_key][0], star_catalog[star_key][1])
+            return self._calculate_azimuth_elevation_manual(ra_hours, dec_degrees, time)
         
         # Use Skyfield for accurate calculation
         try:
-            ra_hours, dec_degrees = star_catalog[star_key]
             
-            # Create star object
-            star = Star(ra_hours=ra_hours, dec_degrees=dec_degrees)
+            # Create star object (reused across calls)
+            star = self._star_cache.get(star_key)
+            if star is None:
+                star = Star(ra_hours=ra_hours, dec_degrees=dec_degrees)
+                self._star_cache[star_key] = star
             
             # Calculate position
-            t = self.ts.now()
+            t = self._current_time() if time is None else self.ts.from_datetime(time)
             # Observe star from observer location
             astrometric = self.observer_wgs84.at(t).observe(star)
             alt, az, distance = astrometric.apparent().altaz()
-            return math.degrees(az.radians), math.degrees(alt.radians)
+            return az.degrees, alt.degrees
         except Exception as e:
             print(f"Error calculating star position: {e}")
-            return self._calculate_azimuth_elevation_manual(ra_hours, dec_degrees)
+            return self._calculate_azimuth_elevation_manual(ra_hours, dec_degrees, time)
+    
+    def get_star_positions(self, names: List[str], time: Optional[datetime] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get positions of several bright stars at once.
+        
+        Args:
+            names: Star names from the bright-star catalog (case-insensitive)
+            time: Observation time (default: now)
+            
+        Returns:
+            tuple: (azimuths_degrees, elevations_degrees) arrays in the order of names;
+                   NaN for names not in the catalog
+        """
+        index = np.fromiter((self._star_names.get(name.lower().strip(), -1) for name in names),
+                            dtype=np.int32, count=len(names))
+        azimuths, elevations = self.calculate_azimuth_elevation(self._star_ra[index], self._star_dec[index], time)
+        unknown = index < 0
+        azimuths[unknown] = np.nan
+        elevations[unknown] = np.nan
+        return azimuths, elevations
+    
+    def all_star_positions(self, time: Optional[datetime] = None) -> Tuple[List[str], np.ndarray, np.ndarray]:
+        """
+        Get positions of every star in the bright-star catalog in one sweep.
+        
+        Args:
+            time: Observation time (default: now)
+            
+        Returns:
+            tuple: (names, azimuths_degrees, elevations_degrees) in catalog order
+        """
+        azimuths, elevations = self._calculate_azimuth_elevation_manual_batch(self._star_ra, self._star_dec, time)
+        return list(self._star_names), azimuths, elevations
     
     def get_planet_position(self, planet_name: str, time: Optional[datetime] = None) -> Optional[Tuple[float, float]]:
         """
@@ -359,7 +604,7 @@ class TargetCalculator:
             return None
         
         if time is None:
-            t = self.ts.now()
+            t = self._current_time()
         else:
             t = self.ts.from_datetime(time)
         
@@ -395,7 +640,7 @@ class TargetCalculator:
         if not self.skyfield_available:
             return None
 
-        t = self.ts.now() if time is None else self.ts.from_datetime(time)
+        t = self._current_time() if time is None else self.ts.from_datetime(time)
 
         try:
             moon = self.eph["moon"]
@@ -437,45 +682,198 @@ class TargetCalculator:
         if not self.skyfield_available:
             return None
         
+        # Quantize to 10 ms so repeated queries (e.g. a UI refresh loop) hit the position cache
         if time is None:
-            t = self.ts.now()
+            centiseconds = round(posix_time() * 100)
+        elif time.tzinfo is None:
+            centiseconds = round(time.replace(tzinfo=timezone.utc).timestamp() * 100)
         else:
-            t = self.ts.from_datetime(time)
+            centiseconds = round(time.timestamp() * 100)
         
         # Handle special cases
         original_id = satellite_id
         if satellite_id.upper() == "ISS" or satellite_id == "25544":
             satellite_id = "25544"  # ISS NORAD ID
         
-        # Check if it's already loaded (by NORAD ID or name)
-        if satellite_id in self.satellites:
+        # Check if it's already loaded (by NORAD ID or exact name)
+        norad_id = satellite_id if satellite_id in self.satellites else \
+            self._name_to_norad.get(satellite_id.strip().upper())
+        if norad_id is not None:
             try:
-                satellite = self.satellites[satellite_id]
-                difference = satellite - self.observer_topos
-                topocentric = difference.at(t)
-                alt, az, distance = topocentric.altaz()
-                return math.degrees(az.radians), math.degrees(alt.radians)
+                azimuth, elevation = self._altaz_cache(norad_id, centiseconds)
             except Exception as e:
                 print(f"Error calculating position for loaded satellite {satellite_id}: {e}")
                 return None
+            if not math.isfinite(elevation):
+                # SGP4 propagation failed (e.g. a decayed orbit)
+                print(f"Error calculating position for loaded satellite {satellite_id}: propagation failed")
+                return None
+            return azimuth, elevation
         
         # Try searching by name in pre-loaded satellites (case-insensitive)
-        search_term_upper = satellite_id.upper()
-        for key, satellite in self.satellites.items():
-            # Check if key is a name (not a numeric NORAD ID) and matches
-            if not key.isdigit() and search_term_upper in key.upper():
-                try:
-                    difference = satellite - self.observer_topos
-                    topocentric = difference.at(t)
-                    alt, az, distance = topocentric.altaz()
-                    return math.degrees(az.radians), math.degrees(alt.radians)
-                except Exception as e:
-                    continue
+        # (a match whose propagation failed comes back non-finite; try the next one)
+        for norad_id in self._find_satellites_by_name(satellite_id):
+            azimuth, elevation = self._altaz_cache(norad_id, centiseconds)
+            if math.isfinite(elevation):
+                return azimuth, elevation
         
         # Not found in pre-loaded satellites
         print(f"Satellite '{original_id}' not found in pre-loaded satellites")
         return None
     
+    def _satellite_altaz_at(self, norad_id: str, centiseconds: int) -> Tuple[float, float]:
+        """
+        Compute one loaded satellite's azimuth/elevation (backs self._altaz_cache).
+        
+        Args:
+            norad_id: NORAD ID of a loaded satellite
+            centiseconds: Time as hundredths of a second since the Unix epoch (UTC)
+            
+        Returns:
+            tuple: (azimuth_degrees, elevation_degrees); NaN if SGP4 failed
+        """
+        t = self.ts.from_datetime(datetime.fromtimestamp(centiseconds / 100.0, tz=timezone.utc))
+        azimuths, elevations = self._satellite_altaz([self._satrecs[norad_id]], t)
+        return float(azimuths[0]), float(elevations[0])
+    
+    def _add_satellite(self, norad_id: str, satellite: EarthSatellite, name: str):
+        """Register a loaded satellite under its NORAD ID and name (internal method)."""
+        self._satrecs[norad_id] = satellite.model
+        self.satellites[norad_id] = satellite
+        self._index_satellite_name(name, norad_id)
+    
+    def _index_satellites(self):
+        """
+        Rebuild the NORAD ID list and batch SatrecArray after loading satellites (internal method).
+        
+        Called once per load rather than per satellite, so the listing methods can
+        take the IDs and propagate the SatrecArray from _satellite_index directly.
+        """
+        with self._satellite_index_lock:
+            items = list(self._satrecs.items())
+            norad_keys = [norad_id for norad_id, _ in items]
+            satrec_array = SatrecArray([satrec for _, satrec in items]) if items else None
+            self._satellite_index = (norad_keys, satrec_array)
+        self._altaz_cache.cache_clear()
+    
+    def _index_satellite_name(self, name: str, norad_id: str):
+        """Add a satellite to the name lookup indexes (internal method)."""
+        name_upper = name.strip().upper()
+        if not name_upper or name_upper.isdigit():
+            return
+        self._name_to_norad[name_upper] = norad_id
+        for token in name_upper.split():
+            self._satellite_tokens.setdefault(token, {})[name_upper] = None
+    
+    def _find_satellites_by_name(self, search_term: str):
+        """
+        Yield NORAD IDs of pre-loaded satellites whose name matches a search term (case-insensitive).
+        
+        Exact name matches come first, then names containing all the search words,
+        then any name containing the search term as a substring; within each pass,
+        satellites come in load order. Each NORAD ID is yielded at most once.
+        
+        Args:
+            search_term: Full or partial satellite name
+        """
+        search_term_upper = search_term.strip().upper()
+        seen = set()
+        
+        norad_id = self._name_to_norad.get(search_term_upper)
+        if norad_id is not None:
+            seen.add(norad_id)
+            yield norad_id
+        
+        tokens = search_term_upper.split()
+        if tokens:
+            candidates = self._satellite_tokens.get(tokens[0], {})
+            others = [self._satellite_tokens.get(token, {}) for token in tokens[1:]]
+            for name_upper in candidates:
+                norad_id = self._name_to_norad[name_upper]
+                if norad_id not in seen and all(name_upper in other for other in others):
+                    seen.add(norad_id)
+                    yield norad_id
+        
+        for name_upper, norad_id in self._name_to_norad.items():
+            if norad_id not in seen and search_term_upper in name_upper:
+                seen.add(norad_id)
+                yield norad_id
+    
+    def _get_http_session(self):
+        """
+        Get the shared HTTP session, creating it on first use.
+        
+        requests is imported here rather than at module level so callers that never
+        download satellite data don't pay for importing it.
+        """
+        if self._http_session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            
+            # Reuse keep-alive connections across Celestrak requests
+            session = requests.Session()
+            session.mount('https://', HTTPAdapter(pool_connections=8, pool_maxsize=8))
+            self._http_session = session
+        return self._http_session
+    
+    def _fetch_tle_text(self, url: str, cache_filename: str, timeout: float) -> Optional[str]:
+        """
+        Get TLE text from Celestrak, reusing a copy cached on disk while it is fresh.
+        
+        Args:
+            url: Celestrak TLE URL
+            cache_filename: File name for the cached copy in the Skyfield data directory
+            timeout: HTTP timeout in seconds
+            
+        Returns:
+            TLE text, or None if it could not be fetched
+        """
+        cache_path = self.loader.path_to(cache_filename)
+        try:
+            cache_age = datetime.now().timestamp() - os.path.getmtime(cache_path)
+        except OSError:
+            cache_age = None
+        
+        if cache_age is not None and cache_age < TLE_CACHE_MAX_AGE_SECONDS:
+            with open(cache_path) as f:
+                return f.read()
+        
+        import requests
+        
+        try:
+            response = self._get_http_session().get(url, timeout=timeout)
+        except requests.RequestException as e:
+            print(f"Failed to fetch TLE from {url}: {e}")
+            response = None
+        
+        if response is None or response.status_code != 200:
+            if response is not None:
+                print(f"Failed to fetch TLE from {url}: HTTP {response.status_code}")
+            if cache_age is not None:
+                # Stale data is better than none when Celestrak is unreachable
+                print(f"Using cached TLE data from {cache_path}")
+                with open(cache_path) as f:
+                    return f.read()
+            return None
+        
+        text = response.text
+        # Only cache responses that contain TLE data (not Celestrak error messages)
+        if '\n1 ' in text:
+            # Write to a temporary file and rename it into place, so concurrent loads of the
+            # same group cannot interleave and an interrupted write leaves no truncated cache
+            temp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            try:
+                with open(temp_path, 'w') as f:
+                    f.write(text)
+                os.replace(temp_path, cache_path)
+            except OSError as e:
+                print(f"Warning: Could not write TLE cache: {e}")
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
+        return text
+    
     def _load_satellite(self, satellite_id: str):
         """Load satellite TLE data from Celestrak."""
         try:
@@ -487,54 +885,41 @@ class TargetCalculator:
             
             # Try multiple URLs and methods
             urls = [
-                'https://celestrak.org/NORAD/elements/stations.txt',
-                'https://celestrak.org/NORAD/elements/gp.php?GROUP=stations&FORMAT=tle',
+                ('https://celestrak.org/NORAD/elements/stations.txt', 'celestrak-stations.txt'),
+                ('https://celestrak.org/NORAD/elements/gp.php?GROUP=stations&FORMAT=tle', 'celestrak-group-stations.tle'),
             ]
             
-            for url in urls:
+            for url, cache_filename in urls:
                 try:
-                    response = requests.get(url, timeout=10)
+                    tle_text = self._fetch_tle_text(url, cache_filename, timeout=10)
                     
-                    if response.status_code == 200:
-                        lines = response.text.strip().split('\n')
-                        # TLE format: name line, line 1, line 2 (repeats)
-                        for i in range(0, len(lines), 3):
-                            if i + 2 < len(lines):
-                                name_line = lines[i].strip()
-                                line1 = lines[i + 1].strip()
-                                line2 = lines[i + 2].strip()
-                                
-                                # Check if this is our satellite by NORAD ID (first number in line 1)
-                                # TLE line 1 format: "1 NNNNNU ..." where NNNNN is NORAD ID
-                                if line1.startswith('1 '):
-                                    try:
-                                        # Extract NORAD ID - it's the second field, first 5 digits
-                                        parts = line1.split()
-                                        if len(parts) >= 2:
-                                            norad_id = parts[1][:5]  # First 5 digits
-                                            if satellite_id == norad_id or original_id.upper() in name_line.upper():
-                                                satellite = EarthSatellite(line1, line2, name_line, self.ts)
-                                                self.satellites[satellite_id] = satellite
-                                                self.satellites[original_id] = satellite  # Also store under original ID
-                                                print(f"Successfully loaded satellite {original_id} (NORAD {satellite_id})")
-                                                return
-                                    except (IndexError, ValueError) as e:
-                                        # Skip malformed TLE lines
-                                        continue
-                except (requests.RequestException, requests.Timeout) as e:
-                    print(f"Failed to fetch TLE from {url}: {e}")
+                    if tle_text is not None:
+                        for norad_id, name_line, line1, line2 in _parse_tle_text(tle_text):
+                            # Check if this is our satellite by NORAD ID or name
+                            if satellite_id == norad_id or original_id.upper() in name_line.upper():
+                                satellite = EarthSatellite(line1, line2, name_line, self.ts)
+                                self._add_satellite(norad_id, satellite, name_line)
+                                self._index_satellites()
+                                print(f"Successfully loaded satellite {original_id} (NORAD {norad_id})")
+                                return
+                except OSError as e:
+                    print(f"Failed to read TLE data for {url}: {e}")
                     continue
             
             # Alternative: Try loading from Skyfield's built-in satellite loader
             try:
                 print(f"Trying Skyfield's built-in TLE loader for {satellite_id}...")
-                satellites = load.tle_file('https://celestrak.org/NORAD/elements/stations.txt')
+                skyfield_filename = 'celestrak-stations-skyfield.txt'
+                reload = (not self.loader.exists(skyfield_filename) or
+                          self.loader.days_old(skyfield_filename) * 86400.0 >= TLE_CACHE_MAX_AGE_SECONDS)
+                satellites = self.loader.tle_file('https://celestrak.org/NORAD/elements/stations.txt',
+                                                  filename=skyfield_filename, reload=reload, ts=self.ts)
                 for sat in satellites:
                     # Check if this satellite matches
                     if hasattr(sat, 'model') and hasattr(sat.model, 'satnum'):
                         if str(sat.model.satnum) == satellite_id:
-                            self.satellites[satellite_id] = sat
-                            self.satellites[original_id] = sat
+                            self._add_satellite(satellite_id, sat, sat.name or original_id)
+                            self._index_satellites()
                             print(f"Successfully loaded satellite {original_id} (NORAD {satellite_id}) via Skyfield")
                             return
             except Exception as e:
@@ -570,22 +955,22 @@ class TargetCalculator:
             url = f'https://celestrak.org/NORAD/elements/gp.php?GROUP={group_name}&FORMAT=tle'
             
             print(f"Loading satellite group '{group_name}' from Celestrak...")
-            response = requests.get(url, timeout=30)
+            tle_text = self._fetch_tle_text(url, f'celestrak-group-{group_name}.tle', timeout=30)
             
-            if response.status_code != 200:
-                print(f"Failed to load group '{group_name}': HTTP {response.status_code}")
+            if tle_text is None:
+                print(f"Failed to load group '{group_name}'")
                 return {"loaded": 0, "failed": 0, "satellites": []}
             
             # Check if response contains an error message
-            response_text = response.text.strip()
+            response_text = tle_text.strip()
             if "Invalid query" in response_text or "not found" in response_text.lower():
                 print(f"Error: Group '{group_name}' is not a valid Celestrak group")
                 print(f"Response: {response_text[:200]}")
                 return {"loaded": 0, "failed": 0, "satellites": []}
             
-            lines = response_text.split('\n')
-            if len(lines) < 3:
-                print(f"Warning: Received insufficient data from Celestrak (only {len(lines)} lines)")
+            tle_entries = _parse_tle_text(response_text)
+            if not tle_entries:
+                print("Warning: Received no TLE data from Celestrak")
                 print(f"First 200 chars: {response_text[:200]}")
                 return {"loaded": 0, "failed": 0, "satellites": []}
             
@@ -593,41 +978,28 @@ class TargetCalculator:
             failed_count = 0
             satellites_info = []
             
-            # TLE format: name line, line 1, line 2 (repeats)
-            for i in range(0, len(lines), 3):
+            for norad_id, name_line, line1, line2 in tle_entries:
                 if limit is not None and loaded_count >= limit:
                     break
+                
+                try:
+                    # Initialize SGP4 once and wrap the same Satrec for Skyfield
+                    satrec = Satrec.twoline2rv(line1, line2)
+                    satellite = EarthSatellite.from_satrec(satrec, self.ts)
+                    satellite.name = name_line
+                    self._add_satellite(norad_id, satellite, name_line)
                     
-                if i + 2 < len(lines):
-                    name_line = lines[i].strip()
-                    line1 = lines[i + 1].strip()
-                    line2 = lines[i + 2].strip()
-                    
-                    # Extract NORAD ID from line 1
-                    if line1.startswith('1 '):
-                        try:
-                            parts = line1.split()
-                            if len(parts) >= 2:
-                                norad_id = parts[1][:5]
-                                
-                                try:
-                                    satellite = EarthSatellite(line1, line2, name_line, self.ts)
-                                    self.satellites[norad_id] = satellite
-                                    self.satellites[name_line.strip()] = satellite  # Also store by name
-                                    
-                                    satellites_info.append({
-                                        "norad_id": norad_id,
-                                        "name": name_line.strip(),
-                                        "satellite": satellite
-                                    })
-                                    loaded_count += 1
-                                except Exception as e:
-                                    failed_count += 1
-                                    continue
-                        except (IndexError, ValueError):
-                            failed_count += 1
-                            continue
+                    satellites_info.append({
+                        "norad_id": norad_id,
+                        "name": name_line,
+                        "satellite": satellite
+                    })
+                    loaded_count += 1
+                except Exception as e:
+                    failed_count += 1
+                    continue
             
+            self._index_satellites()
             print(f"Loaded {loaded_count} satellites from group '{group_name}' (failed: {failed_count})")
             return {
                 "loaded": loaded_count,
@@ -639,6 +1011,62 @@ class TargetCalculator:
             print(f"Error loading satellite group '{group_name}': {e}")
             return {"loaded": 0, "failed": 0, "satellites": []}
     
+    def _satellite_altaz(self, satrecs, t,
+                         min_elevation: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Compute azimuth/elevation for many satellites at one time in a single batch.
+        
+        Propagates all satellites with one SGP4 array call, rotates the TEME positions
+        into the Earth-fixed frame and converts them to the observer's local horizon.
+        
+        Args:
+            satrecs: SatrecArray, or list of SGP4 Satrec objects (see self._satrecs)
+            t: Skyfield Time of observation
+            min_elevation: If set, satellites below this elevation (degrees) are culled
+                           with a cheap test and left as NaN instead of fully converted
+            
+        Returns:
+            tuple: (azimuths_degrees, elevations_degrees) arrays; NaN where SGP4 failed
+                   (or the satellite was culled)
+        """
+        # Propagate all satellites at once (TEME frame, km)
+        jd, fr = jday(*t.utc)
+        if not isinstance(satrecs, SatrecArray):
+            satrecs = SatrecArray(satrecs)
+        errors, positions, _ = satrecs.sgp4(
+            np.array([jd]), np.array([fr]))
+        positions = positions[:, 0, :]
+        
+        # TEME -> Earth-fixed: rotate about z by Greenwich mean sidereal angle
+        theta, _ = theta_GMST1982(t.whole, t.ut1_fraction)
+        cos_theta, sin_theta = math.cos(theta), math.sin(theta)
+        teme_to_ecef = np.array([
+            [cos_theta, sin_theta, 0.0],
+            [-sin_theta, cos_theta, 0.0],
+            [0.0, 0.0, 1.0],
+        ])
+        
+        # Earth-fixed position relative to the observer (rows are satellites, so rotate by R.T)
+        relative = positions @ teme_to_ecef.T - self._observer_itrf_xyz
+        
+        azimuths = np.full(len(satrecs), np.nan)
+        elevations = np.full(len(satrecs), np.nan)
+        keep = errors[:, 0] == 0
+        if min_elevation is not None:
+            # Horizon cull: sin(elevation) is the Up component of the line of sight over its length
+            up = relative @ self._observer_rotation_ecef_to_enu[2]
+            if min_elevation == 0.0:
+                keep &= up >= 0.0  # At the horizon the sign of the Up component is enough
+            else:
+                keep &= up >= math.sin(min_elevation * DEG2RAD) * np.linalg.norm(relative, axis=1)
+        
+        # Earth-fixed -> local East/North/Up
+        enu = relative[keep] @ self._observer_rotation_ecef_to_enu.T
+        east, north, up = enu[:, 0], enu[:, 1], enu[:, 2]
+        elevations[keep] = np.arctan2(up, np.hypot(east, north)) * RAD2DEG
+        azimuths[keep] = (np.arctan2(east, north) * RAD2DEG) % 360.0
+        return azimuths, elevations
+    
     def find_nearest_visible_satellite(self, groups: List[Dict[str, Any]], 
                                        min_elevation: float = 0.0,
                                        time: Optional[datetime] = None) -> Optional[Tuple[str, str, float, float]]:
@@ -656,114 +1084,106 @@ class TargetCalculator:
         if not self.skyfield_available:
             return None
         
-        # Load all groups
+        # Load all groups concurrently (each is a separate Celestrak download)
+        groups = [group_config for group_config in groups if group_config.get("group_name")]
         all_satellites = []
-        for group_config in groups:
-            group_name = group_config.get("group_name")
-            limit = group_config.get("limit")
-            
-            if group_name:
-                result = self.load_satellite_group(group_name, limit)
-                all_satellites.extend(result["satellites"])
+        if groups:
+            with ThreadPoolExecutor(max_workers=min(8, len(groups))) as executor:
+                results = executor.map(
+                    lambda group_config: self.load_satellite_group(group_config["group_name"], group_config.get("limit")),
+                    groups)
+                for result in results:
+                    all_satellites.extend(result["satellites"])
         
         if not all_satellites:
             return None
         
+        # Groups overlap (e.g. the ISS is in both "stations" and "visual"); key by NORAD ID
+        # so each satellite is propagated once, in first-seen order
+        unique_satellites = list({sat_info["norad_id"]: sat_info for sat_info in all_satellites}.values())
+        
         # Get observation time
         if time is None:
-            t = self.ts.now()
+            t = self._current_time()
         else:
             t = self.ts.from_datetime(time)
         
         # Find the satellite with highest elevation above min_elevation
-        best_satellite = None
-        best_elevation = min_elevation - 1.0  # Start below minimum
+        try:
+            azimuths, elevations = self._satellite_altaz(
+                [self._satrecs[sat_info["norad_id"]] for sat_info in unique_satellites], t,
+                min_elevation=min_elevation)
+        except Exception as e:
+            print(f"Error calculating satellite positions: {e}")
+            return None
         
-        for sat_info in all_satellites:
-            try:
-                satellite = sat_info["satellite"]
-                norad_id = sat_info["norad_id"]
-                name = sat_info["name"]
-                
-                difference = satellite - self.observer_topos
-                topocentric = difference.at(t)
-                alt, az, distance = topocentric.altaz()
-                
-                elevation_deg = math.degrees(alt.radians)
-                
-                # Check if above minimum elevation and better than current best
-                if elevation_deg >= min_elevation and elevation_deg > best_elevation:
-                    best_elevation = elevation_deg
-                    azimuth_deg = math.degrees(az.radians)
-                    best_satellite = (norad_id, name, azimuth_deg, elevation_deg)
-            except Exception as e:
-                # Skip satellites that can't be calculated
-                continue
+        # Satellites that can't be calculated (NaN) or are too low are excluded
+        candidates = np.where(elevations >= min_elevation, elevations, -np.inf)
+        best = int(np.argmax(candidates))
+        if not np.isfinite(candidates[best]):
+            return None
         
-        return best_satellite
+        sat_info = unique_satellites[best]
+        return (sat_info["norad_id"], sat_info["name"], float(azimuths[best]), float(elevations[best]))
     
-    def get_preloaded_satellites(self) -> List[Dict[str, Any]]:
+    def get_preloaded_satellites_array(self) -> np.ndarray:
         """
-        Get list of all preloaded satellites with their names, IDs, and current visibility.
+        Get all preloaded satellites with their current visibility as a structured array.
         
         Returns:
-            list: List of dictionaries with 'name', 'norad_id', 'id', 'elevation', and 'azimuth'
+            np.ndarray: SATELLITE_DTYPE records ('name', 'norad_id', 'elevation', 'azimuth'),
+                        sorted by elevation (lowest first, so highest is at the end)
         """
         if not self.skyfield_available:
-            return []
-        
-        satellites_list = []
-        seen_satellites = set()  # Track satellite objects we've already processed
-        t = self.ts.now()  # Current time for position calculation
-        
-        # Iterate through all satellites, but only add unique ones
-        for key, satellite in self.satellites.items():
-            # Use the satellite object itself as the unique identifier
-            if satellite in seen_satellites:
-                continue
-            
-            # Only process NORAD ID keys (numeric keys)
-            if key.isdigit():
-                norad_id = key
-                seen_satellites.add(satellite)
-                
-                # Find the name for this satellite (it's stored as another key)
-                name = None
-                for name_key, sat_obj in self.satellites.items():
-                    if not name_key.isdigit() and sat_obj is satellite:
-                        name = name_key
-                        break
-                
-                if name is None:
-                    name = f"NORAD {norad_id}"
-                
-                # Calculate current position
-                elevation = None
-                azimuth = None
-                try:
-                    difference = satellite - self.observer_topos
-                    topocentric = difference.at(t)
-                    alt, az, distance = topocentric.altaz()
-                    elevation = math.degrees(alt.radians)
-                    azimuth = math.degrees(az.radians)
-                except Exception as e:
-                    # If calculation fails, set elevation to very low value
-                    elevation = -90.0
-                    azimuth = 0.0
-                
-                satellites_list.append({
-                    "name": name,
-                    "norad_id": norad_id,
-                    "id": norad_id,  # Use NORAD ID for API pointing
-                    "elevation": elevation,
-                    "azimuth": azimuth
-                })
+            return np.empty(0, dtype=SATELLITE_DTYPE)
+        
+        t = self._current_time()  # Current time for position calculation
+        
+        norad_ids, satrec_array = self._satellite_index
+        if not norad_ids:
+            return np.empty(0, dtype=SATELLITE_DTYPE)
+        
+        # Calculate current positions for all satellites in one batch
+        try:
+            azimuths, elevations = self._satellite_altaz(satrec_array, t)
+        except Exception as e:
+            print(f"Error calculating satellite positions: {e}")
+            azimuths = np.full(len(norad_ids), np.nan)
+            elevations = np.full(len(norad_ids), np.nan)
+        
+        # If calculation fails (NaN/inf from SGP4 errors or the fallback above), set elevation to very low value
+        failed = ~np.isfinite(elevations)
+        elevations[failed] = -90.0
+        azimuths[failed] = 0.0
+        
+        # Satellites are stored once, under their NORAD ID, so no dedup or name scan is needed
+        satellites = np.empty(len(norad_ids), dtype=SATELLITE_DTYPE)
+        satellites['name'] = [self.satellites[norad_id].name or f"NORAD {norad_id}" for norad_id in norad_ids]
+        satellites['norad_id'] = norad_ids
+        satellites['elevation'] = elevations
+        satellites['azimuth'] = azimuths
         
         # Sort by elevation (lowest first), so highest is at bottom
         # Satellites below horizon (negative elevation) will be at top
-        satellites_list.sort(key=lambda x: x["elevation"], reverse=False)
+        return satellites[np.argsort(elevations, kind='stable')]
+    
+    def get_preloaded_satellites(self) -> List[Dict[str, Any]]:
+        """
+        Get list of all preloaded satellites with their names, IDs, and current visibility.
         
-        return satellites_list
+        Returns:
+            list: List of dictionaries with 'name', 'norad_id', 'id', 'elevation', and 'azimuth'
+        """
+        return [
+            {
+                "name": name,
+                "norad_id": norad_id,
+                "id": norad_id,  # Use NORAD ID for API pointing
+                "elevation": elevation,
+                "azimuth": azimuth
+            }
+            for name, norad_id, elevation, azimuth in self.get_preloaded_satellites_array().tolist()
+        ]
     
     def get_iss_position(self, time: Optional[datetime] = None) -> Optional[Tuple[float, float]]:
         """
@@ -777,6 +1197,55 @@ class TargetCalculator:
         """
         return self.get_satellite_position("ISS", time)
     
+    def calculate_azimuth_elevation(self, target_ra, target_dec, time: Optional[datetime] = None):
+        """
+        Convert RA/Dec coordinates to azimuth/elevation for the observer.
+        
+        Accepts a single target or arrays of targets; arrays are converted in one
+        vectorized pass sharing a single sidereal time.
+        
+        Args:
+            target_ra: Right ascension in hours (scalar or array-like)
+            target_dec: Declination in degrees (scalar or array-like, same shape as target_ra)
+            time: Observation time (default: now)
+            
+        Returns:
+            tuple: (azimuth_degrees, elevation_degrees) as floats for scalar input,
+                   or as arrays shaped like the input
+        """
+        ra_hours = np.asarray(target_ra, dtype=np.float64)
+        dec_degrees = np.asarray(target_dec, dtype=np.float64)
+        if ra_hours.ndim == 0 and dec_degrees.ndim == 0:
+            return self._calculate_azimuth_elevation_manual(float(ra_hours), float(dec_degrees), time)
+        
+        ra_hours, dec_degrees = np.broadcast_arrays(ra_hours, dec_degrees)
+        azimuths, elevations = self._calculate_azimuth_elevation_manual_batch(ra_hours, dec_degrees, time)
+        return azimuths.reshape(ra_hours.shape), elevations.reshape(ra_hours.shape)
+    
+    def calculate_azimuth_elevation_grid(self, target_ra, target_dec,
+                                         times: List[datetime]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Convert RA/Dec targets to azimuth/elevation at each of several times.
+        
+        The sidereal time is computed once per time and shared by all targets.
+        
+        Args:
+            target_ra: Right ascensions in hours (array-like, one per target)
+            target_dec: Declinations in degrees (array-like, same length as target_ra)
+            times: Observation times
+            
+        Returns:
+            tuple: (azimuth_degrees, elevation_degrees) arrays of shape (len(times), n_targets)
+        """
+        ra_rad = (np.asarray(target_ra, dtype=np.float64) * HOURS2RAD).ravel()
+        dec_rad = (np.asarray(target_dec, dtype=np.float64) * DEG2RAD).ravel()
+        gmst = self._gmst_interp(self._julian_day_array(times))
+        lst_rad = (gmst + self.longitude) * DEG2RAD
+        
+        azimuths = np.empty((lst_rad.size, ra_rad.size))
+        elevations = np.empty((lst_rad.size, ra_rad.size))
+        radec_to_azel_grid(ra_rad, dec_rad, lst_rad, self._sin_lat, self._cos_lat, azimuths, elevations)
+        return azimuths, elevations
     
     def _calculate_azimuth_elevation_manual(self, ra_hours: float, dec_degrees: float,
                                            time: Optional[datetime] = None) -> Tuple[float, float]:
@@ -791,72 +1260,135 @@ class TargetCalculator:
         Returns:
             tuple: (azimuth_degrees, elevation_degrees)
         """
-        if time is None:
-            time = datetime.utcnow()
-        
-        # Convert RA to radians
-        ra_rad = math.radians(ra_hours * 15.0)  # RA in hours to degrees
-        dec_rad = math.radians(dec_degrees)
-        lat_rad = math.radians(self.latitude)
-        lon_rad = math.radians(self.longitude)
-        
-        # Calculate Local Sidereal Time
+        # Calculate Local Sidereal Time (now, if no time is given)
         lst_hours = self._calculate_lst(time)
-        lst_rad = math.radians(lst_hours * 15.0)
-        
-        # Hour angle
-        ha_rad = lst_rad - ra_rad
         
-        # Calculate elevation (altitude)
-        sin_elevation = (math.sin(lat_rad) * math.sin(dec_rad) +
-                        math.cos(lat_rad) * math.cos(dec_rad) * math.cos(ha_rad))
-        elevation_rad = math.asin(sin_elevation)
-        elevation = math.degrees(elevation_rad)
-        
-        # Calculate azimuth
-        cos_azimuth = ((math.sin(dec_rad) - math.sin(lat_rad) * sin_elevation) /
-                      (math.cos(lat_rad) * math.cos(elevation_rad)))
-        azimuth_rad = math.acos(max(-1, min(1, cos_azimuth)))
+        return radec_to_azel(float(ra_hours), float(dec_degrees), self._sin_lat, self._cos_lat, lst_hours)
+    
+    def _calculate_azimuth_elevation_manual_batch(self, ra_hours: np.ndarray, dec_degrees: np.ndarray,
+                                                 time: Optional[datetime] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Manual calculation of azimuth/elevation for many RA/Dec pairs at once (fallback).
         
-        # Determine quadrant
-        if math.sin(ha_rad) > 0:
-            azimuth_rad = 2 * math.pi - azimuth_rad
+        Args:
+            ra_hours: Array of right ascensions in hours
+            dec_degrees: Array of declinations in degrees
+            time: Observation time (default: now)
+            
+        Returns:
+            tuple: (azimuths_degrees, elevations_degrees) arrays
+        """
+        # Sidereal time and latitude terms are shared by every target
+        lst_rad = self._calculate_lst(time) * HOURS2RAD
+        ra_rad = (np.asarray(ra_hours, dtype=np.float64) * HOURS2RAD).ravel()
+        dec_rad = (np.asarray(dec_degrees, dtype=np.float64) * DEG2RAD).ravel()
         
-        azimuth = math.degrees(azimuth_rad) % 360
+        if ra_rad.size >= GPU_BATCH_THRESHOLD and gpu_available():
+            try:
+                return radec_to_azel_gpu(ra_rad, dec_rad, lst_rad, self._sin_lat, self._cos_lat)
+            except Exception as e:
+                print(f"GPU azimuth/elevation conversion failed, using the CPU: {e}")
         
-        return azimuth, elevation
+        azimuths = np.empty(ra_rad.size)
+        elevations = np.empty(ra_rad.size)
+        radec_to_azel_batch(ra_rad, dec_rad, lst_rad, self._sin_lat, self._cos_lat, azimuths, elevations)
+        return azimuths, elevations
     
-    def _calculate_lst(self, time: datetime) -> float:
+    def _calculate_lst(self, time: Optional[datetime] = None) -> float:
         """
         Calculate Local Sidereal Time.
         
         Args:
-            time: Observation time
+            time: Observation time (default: now)
             
         Returns:
             LST in hours
         """
-        jd = self._julian_day(time)
-        t = (jd - 2451545.0) / 36525.0
+        jd = self._now_jd() if time is None else self._julian_day(time)
+        return ((self._gmst_interp(jd) + self.longitude) % 360.0) / 15.0
+    
+    def _gmst_table(self, start_jd: float, end_jd: float, step: float = GMST_TABLE_STEP_DAYS):
+        """
+        Precompute GMST on a regular Julian Day grid covering [start_jd, end_jd].
+        
+        The grid starts on a whole multiple of the step, so with the default step its
+        points fall on whole UTC minutes.
+        
+        Args:
+            start_jd: First Julian Day to cover
+            end_jd: Last Julian Day to cover
+            step: Grid spacing in days (default: 1 minute)
+        """
+        start = math.floor(start_jd / step) * step
+        count = int(math.ceil((end_jd - start) / step)) + 1
+        jd_grid = start + step * np.arange(count, dtype=np.float64)
+        gmst_grid = _gmst_degrees(jd_grid)
+        # (jd_grid, gmst_grid, start, step, GMST as a list) as one tuple, so concurrent readers
+        # never see a grid paired with another grid's values; the plain-float copies serve the
+        # scalar path, where indexing NumPy arrays would dominate the cost
+        self._gmst_grid = (jd_grid, gmst_grid, start, step, gmst_grid.tolist())
+    
+    def _gmst_interp(self, jd):
+        """
+        Greenwich Mean Sidereal Time by linear interpolation in the GMST table.
         
-        # Greenwich Mean Sidereal Time
-        gmst = (280.46061837 + 360.98564736629 * (jd - 2451545.0) +
-                0.000387933 * t * t - t * t * t / 38710000.0) % 360.0
+        A single time outside the table re-centres the table on it; arrays reaching
+        outside the table are evaluated from the polynomial directly.
         
-        # Local Sidereal Time
-        lst = (gmst + self.longitude) % 360.0
+        Args:
+            jd: Julian Day (float) or array of Julian Days
+            
+        Returns:
+            GMST in degrees, in [0, 360): a float for a single time, else an array
+        """
+        jd_grid, gmst_grid, start, step, gmst_values = self._gmst_grid
+        if isinstance(jd, (float, int)):
+            # The grid is regular, so the bracketing points are found by index rather
+            # than np.interp's search (this is the per-call path for scalar LST)
+            offset = (jd - start) / step
+            index = int(offset)
+            if not 0 <= offset < len(gmst_values) - 1:
+                self._gmst_table(jd - GMST_TABLE_SPAN_DAYS / 2, jd + GMST_TABLE_SPAN_DAYS / 2)
+                return self._gmst_interp(jd)
+            gmst0 = gmst_values[index]
+            return (gmst0 + (offset - index) * (gmst_values[index + 1] - gmst0)) % 360.0
         
-        return lst / 15.0  # Convert to hours
+        jd = np.asarray(jd, dtype=np.float64)
+        if jd.size and not (jd_grid[0] <= jd.min() and jd.max() <= jd_grid[-1]):
+            return _gmst_degrees(jd) % 360.0
+        return np.interp(jd, jd_grid, gmst_grid) % 360.0
     
-    def _julian_day(self, time: datetime) -> float:
-        """Calculate Julian Day."""
-        a = (14 - time.month) // 12
-        y = time.year + 4800 - a
-        m = time.month + 12 * a - 3
+    def _now_jd(self) -> float:
+        """Julian Day of the current instant, computed without building a datetime."""
+        return posix_time() / 86400.0 + UNIX_EPOCH_JD
+    
+    def _julian_day_array(self, times: List[datetime]) -> np.ndarray:
+        """
+        Calculate Julian Days for many datetimes at once (wall-clock times are taken as UTC).
         
-        jdn = (time.day + (153 * m + 2) // 5 + 365 * y +
-               y // 4 - y // 100 + y // 400 - 32045)
+        Only the proleptic Gregorian day ordinal and the seconds into the day are pulled
+        out per datetime; the Julian Day arithmetic then runs as whole-array operations.
         
-        jd = jdn + (time.hour - 12) / 24.0 + time.minute / 1440.0 + time.second / 86400.0
+        Args:
+            times: Observation times
+            
+        Returns:
+            np.ndarray: Julian Days (float64)
+        """
+        count = len(times)
+        ordinals = np.fromiter((time.toordinal() for time in times), dtype=np.int64, count=count)
+        seconds = np.fromiter((time.hour * 3600 + time.minute * 60 + time.second + time.microsecond * 1e-6
+                               for time in times), dtype=np.float64, count=count)
+        # Ordinal 1 is 0001-01-01, whose midnight is JD 1721425.5
+        return (ordinals + 1721424.5) + seconds / 86400.0
+    
+    def _julian_day(self, time: datetime) -> float:
+        """
+        Calculate Julian Day (the datetime's wall-clock time is taken as UTC).
         
-        return jd
+        The day number is the proleptic Gregorian ordinal, an exact integer for any
+        year, so dates far from 1970 do not pick up float rounding from a timestamp.
+        """
+        seconds = time.hour * 3600 + time.minute * 60 + time.second + time.microsecond * 1e-6
+        # Ordinal 1 is 0001-01-01, whose midnight is JD 1721425.5
+        return (time.toordinal() + 1721424.5) + seconds / 86400.0
@@ -6,6 +6,8 @@ import unittest
 from unittest.mock import Mock, patch
 import sys
 import os
+import threading
+import time
 
 # Add parent directory to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -62,6 +64,84 @@ class TestMotorController(unittest.TestCase):
         self.assertEqual(self.controller.get_motor2_position(), 0)
 
 
+
+class TestMotor1Coalescing(unittest.TestCase):
+    """Test cases for coalescing motor 1 moves onto an in-flight move."""
+    
+    @patch('celestial_pointer.motor_controller.RpiMotorLib')
+    def setUp(self, mock_rpimotor):
+        """Set up a controller whose motor 1 driver blocks until released."""
+        self.controller = MotorController()
+        self.run_steps = []
+        self.run_started = threading.Semaphore(0)
+        self.run_release = threading.Semaphore(0)
+        
+        def motor_run(pins, delay, steps, clockwise, verbose, step_type, init_delay):
+            self.run_steps.append(steps)
+            self.run_started.release()
+            self.assertTrue(self.run_release.acquire(timeout=5))
+        
+        self.controller.motor1 = Mock()
+        self.controller.motor1.motor_run.side_effect = motor_run
+    
+    def _move_in_thread(self, steps):
+        """Start a clockwise motor 1 move on a background thread."""
+        thread = threading.Thread(target=self.controller.move_motor1, args=(steps,),
+                                  kwargs={'clockwise': True})
+        thread.start()
+        return thread
+    
+    def test_coalesced_moves_return_immediately(self):
+        """Test same-direction moves during a move are merged into one follow-on run."""
+        first = self._move_in_thread(10)
+        self.assertTrue(self.run_started.acquire(timeout=5))
+        
+        start = time.monotonic()
+        self.controller.move_motor1(5, clockwise=True)
+        self.controller.move_motor1(7, clockwise=True)
+        self.assertLess(time.monotonic() - start, 0.5)
+        
+        self.run_release.release(2)
+        first.join(timeout=5)
+        self.assertFalse(first.is_alive())
+        self.assertEqual(self.run_steps, [10, 12])
+        self.assertEqual(self.controller.motor1_position, 22)
+    
+    def test_coalesced_steps_ignore_sign(self):
+        """Test opposite-signed coalesced steps still all run (direction comes from clockwise)."""
+        first = self._move_in_thread(10)
+        self.assertTrue(self.run_started.acquire(timeout=5))
+        self.controller.move_motor1(5, clockwise=True)
+        self.controller.move_motor1(-5, clockwise=True)
+        
+        self.run_release.release(2)
+        first.join(timeout=5)
+        self.assertFalse(first.is_alive())
+        self.assertEqual(self.run_steps, [10, 10])
+        # The position follows the signed step counts, as for uncoalesced moves
+        self.assertEqual(self.controller.motor1_position, 10)
+    
+    def test_coalescing_is_capped_per_move(self):
+        """Test follow-on steps are capped in total, not per drained batch."""
+        first = self._move_in_thread(10)
+        self.assertTrue(self.run_started.acquire(timeout=5))
+        self.controller.move_motor1(100, clockwise=True)
+        
+        # The follow-on run of 100 starts; another 100 would exceed the cap, so it waits
+        self.run_release.release()
+        self.assertTrue(self.run_started.acquire(timeout=5))
+        second = self._move_in_thread(100)
+        second.join(timeout=0.2)
+        self.assertTrue(second.is_alive())
+        
+        self.run_release.release(2)
+        first.join(timeout=5)
+        second.join(timeout=5)
+        self.assertFalse(first.is_alive() or second.is_alive())
+        self.assertEqual(self.run_steps, [10, 100, 100])
+        self.assertEqual(self.controller.motor1_position, 210)
+
+
 if __name__ == '__main__':
     unittest.main()
 
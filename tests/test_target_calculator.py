@@ -3,22 +3,41 @@ Tests for target calculator.
 """
 
 import unittest
+from unittest.mock import MagicMock, Mock, patch
 import sys
 import os
-from datetime import datetime
+import lzma
+import math
+import pickle
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+import numpy as np
+import pandas as pd
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from celestial_pointer.target_calculator import TargetCalculator
+from celestial_pointer import _kernels
+from celestial_pointer.target_calculator import (TargetCalculator, BRIGHT_STARS, GPU_BATCH_THRESHOLD,
+                                                 HIPPARCOS_CACHE_FILENAME, _gmst_degrees)
+
+# Wall-clock timing tests only run when asked for, so the default suite stays deterministic
+RUN_PERF_TESTS = bool(os.environ.get("RUN_PERF_TESTS"))
 
 
 class TestTargetCalculator(unittest.TestCase):
     """Test cases for TargetCalculator."""
     
-    def setUp(self):
-        """Set up test fixtures."""
+    @classmethod
+    def setUpClass(cls):
+        """Set up one calculator shared by all tests (tests must not change its location)."""
         # Use test coordinates (San Francisco)
-        self.calculator = TargetCalculator(latitude=37.7749, longitude=-122.4194, altitude=0.0)
+        cls.calculator = TargetCalculator(latitude=37.7749, longitude=-122.4194, altitude=0.0)
+    
+    def _separate_calculator(self):
+        """Build a calculator of its own, without preloaded satellites or the star catalog."""
+        with patch.object(TargetCalculator, '_preload_brightest_satellites'):
+            return TargetCalculator(latitude=37.7749, longitude=-122.4194, altitude=0.0, load_star_chart=False)
     
     def test_initialization(self):
         """Test calculator initialization."""
@@ -36,11 +55,64 @@ class TestTargetCalculator(unittest.TestCase):
         self.assertIsInstance(elevation, (int, float))
         self.assertTrue(0 <= azimuth <= 360)
         self.assertTrue(-90 <= elevation <= 90)
+        
+        # Batch lookup of several stars
+        azimuths, elevations = self.calculator.get_star_positions(["Sirius", "Vega", "Betelgeuse"])
+        self.assertEqual(azimuths.shape, (3,))
+        self.assertEqual(elevations.shape, (3,))
+        self.assertTrue(np.all((azimuths >= 0) & (azimuths <= 360)))
+        self.assertTrue(np.all((elevations >= -90) & (elevations <= 90)))
+    
+    def test_all_stars_batch(self):
+        """Test the full-catalog sweep matches per-star results."""
+        test_date = datetime(2024, 1, 1, 6, 0, 0)
+        names, azimuths, elevations = self.calculator.all_star_positions(test_date)
+        self.assertEqual(len(names), len(azimuths))
+        self.assertEqual(len(names), len(elevations))
+        for name, azimuth, elevation in zip(names, azimuths, elevations):
+            # The stored (float32) catalog values, which the sweep converts
+            index = self.calculator._star_names[name]
+            ra_hours, dec_degrees = self.calculator._star_ra[index], self.calculator._star_dec[index]
+            self.assertAlmostEqual(ra_hours, BRIGHT_STARS[name][0], places=5)
+            self.assertAlmostEqual(dec_degrees, BRIGHT_STARS[name][1], places=4)
+            expected_az, expected_el = self.calculator.calculate_azimuth_elevation(ra_hours, dec_degrees, test_date)
+            self.assertAlmostEqual(azimuth, expected_az, delta=1e-10)
+            self.assertAlmostEqual(elevation, expected_el, delta=1e-10)
+    
+    @unittest.skipUnless(RUN_PERF_TESTS, "set RUN_PERF_TESTS=1 to run timing tests")
+    def test_bulk_lookup_scales(self):
+        """Time a 1000-name batch lookup (guards against per-name catalog scans)."""
+        catalog = list(self.calculator._star_names)
+        names = [catalog[i % len(catalog)] for i in range(1000)]
+        start = time.perf_counter()
+        azimuths, elevations = self.calculator.get_star_positions(names)
+        elapsed = time.perf_counter() - start
+        self.assertEqual(azimuths.shape, (1000,))
+        self.assertLess(elapsed, 0.05, f"1000-name lookup took {elapsed * 1000:.1f}ms")
+    
+    def test_star_position_cache(self):
+        """Test repeated star queries within the same second are served from the cache."""
+        test_date = datetime(2024, 1, 1, 6, 0, 0)
+        first = self.calculator.get_star_position("Vega", test_date)
+        hits = self.calculator._star_position_cache.cache_info().hits
+        second = self.calculator.get_star_position("Vega", test_date + timedelta(milliseconds=200))
+        self.assertEqual(first, second)
+        self.assertEqual(self.calculator._star_position_cache.cache_info().hits, hits + 1)
+        
+        # The cached position is the uncached one for the requested time, not for "now"
+        seconds = round(test_date.replace(tzinfo=timezone.utc).timestamp())
+        self.assertEqual(first, self.calculator._star_position_at("Vega", seconds))
     
     def test_star_not_found(self):
         """Test handling of unknown star."""
         position = self.calculator.get_star_position("NonexistentStar")
         self.assertIsNone(position)
+        
+        # Batch lookups mark unknown names with NaN and still resolve the known ones
+        azimuths, elevations = self.calculator.get_star_positions(["NonexistentStar", " SIRIUS ", ""])
+        self.assertTrue(np.isnan(azimuths[0]) and np.isnan(elevations[0]))
+        self.assertTrue(np.isfinite(azimuths[1]) and np.isfinite(elevations[1]))
+        self.assertTrue(np.isnan(azimuths[2]) and np.isnan(elevations[2]))
     
     def test_azimuth_elevation_calculation(self):
         """Test azimuth/elevation calculation."""
@@ -54,12 +126,231 @@ class TestTargetCalculator(unittest.TestCase):
         self.assertTrue(0 <= azimuth <= 360)
         self.assertTrue(-90 <= elevation <= 90)
     
+    def test_azimuth_elevation_batch(self):
+        """Test azimuth/elevation calculation over arrays of targets."""
+        ra_hours = np.array([6.752, 5.242, 18.616, 5.919])  # Sirius, Rigel, Vega, Betelgeuse
+        dec_degrees = np.array([-16.716, -8.202, 38.784, 7.407])
+        test_date = datetime(2024, 1, 1, 6, 0, 0)
+        azimuths, elevations = self.calculator.calculate_azimuth_elevation(ra_hours, dec_degrees, test_date)
+        self.assertEqual(azimuths.shape, ra_hours.shape)
+        self.assertEqual(elevations.shape, ra_hours.shape)
+        self.assertTrue(np.all((azimuths >= 0) & (azimuths <= 360)))
+        self.assertTrue(np.all((elevations >= -90) & (elevations <= 90)))
+        
+        # Each element matches the scalar call
+        azimuth, elevation = self.calculator.calculate_azimuth_elevation(ra_hours[0], dec_degrees[0], test_date)
+        self.assertAlmostEqual(azimuths[0], azimuth, places=6)
+        self.assertAlmostEqual(elevations[0], elevation, places=6)
+    
+    def test_azimuth_elevation_grid(self):
+        """Test the times x targets grid matches the scalar calculation."""
+        start = datetime(2024, 1, 1, 0, 0, 0)
+        times = [start + timedelta(minutes=7 * i, seconds=13) for i in range(100)]
+        rng = np.random.default_rng(1)
+        ra_hours = rng.uniform(0.0, 24.0, 50)
+        dec_degrees = rng.uniform(-89.0, 89.0, 50)
+        azimuths, elevations = self.calculator.calculate_azimuth_elevation_grid(ra_hours, dec_degrees, times)
+        self.assertEqual(azimuths.shape, (100, 50))
+        self.assertEqual(elevations.shape, (100, 50))
+        for i, j in ((0, 0), (17, 42), (99, 49), (63, 5)):
+            azimuth, elevation = self.calculator.calculate_azimuth_elevation(ra_hours[j], dec_degrees[j], times[i])
+            self.assertAlmostEqual(azimuths[i, j], azimuth, places=6)
+            self.assertAlmostEqual(elevations[i, j], elevation, places=6)
+    
+    def test_find_satellites_by_name_order(self):
+        """Test name matches come back in load order, each NORAD ID once."""
+        # Own instance with no preloaded satellites, so only these entries are indexed
+        calculator = self._separate_calculator()
+        for norad_id, name in (("10001", "ISS (ZARYA)"), ("10002", "COSMOS 1"), ("10003", "COSMOS 2"),
+                               ("10004", "COSMOS 3 DEB"), ("10005", "NOAA 15"), ("10006", "NOAA 18")):
+            calculator._index_satellite_name(name, norad_id)
+        
+        self.assertEqual(list(calculator._find_satellites_by_name("cosmos")), ["10002", "10003", "10004"])
+        self.assertEqual(list(calculator._find_satellites_by_name("noaa")), ["10005", "10006"])
+        # The exact match is not repeated by the word and substring passes
+        self.assertEqual(list(calculator._find_satellites_by_name("noaa 18")), ["10006"])
+        self.assertEqual(list(calculator._find_satellites_by_name("cos")), ["10002", "10003", "10004"])
+    
+    def test_star_catalog_cache_rebuilt_when_corrupt(self):
+        """Test a truncated Hipparcos cache is replaced by a fresh one from the parsed catalog."""
+        catalog = pd.DataFrame({'ra_degrees': [101.28, 37.95, np.nan], 'dec_degrees': [-16.72, 89.26, 0.0]},
+                               index=pd.Index([32349, 11767, 5], name='hip'))
+        with tempfile.TemporaryDirectory() as data_dir:
+            cache_path = os.path.join(data_dir, HIPPARCOS_CACHE_FILENAME)
+            with open(cache_path, 'wb') as f:
+                f.write(b'\xfd7zXZ\x00 truncated')
+            
+            calculator = self._separate_calculator()
+            calculator.loader = MagicMock()
+            calculator.loader.path_to.side_effect = lambda filename: os.path.join(data_dir, filename)
+            with patch('skyfield.data.hipparcos.load_dataframe', return_value=catalog):
+                calculator._load_star_catalog()
+            
+            self.assertEqual(set(calculator._hip_lookup), {32349, 11767})
+            self.assertAlmostEqual(calculator._hip_lookup[32349][0], 101.28 / 15.0, places=5)
+            # The rewritten cache is complete and no temporary file is left behind
+            self.assertEqual(os.listdir(data_dir), [HIPPARCOS_CACHE_FILENAME])
+            with lzma.open(cache_path, 'rb') as f:
+                hip_ids, _ = pickle.loads(f.read())
+            self.assertEqual(sorted(hip_ids.tolist()), [11767, 32349])
+    
+    def test_tle_cache_written_by_rename(self):
+        """Test fetched TLE text is cached as a complete file and reused while fresh."""
+        tle_text = "ISS (ZARYA)\n1 25544U 98067A   24001.50000000  .00016717  00000-0  10270-3 0  9005\n" \
+                   "2 25544  51.6416 247.4627 0006703 130.5360 325.0288 15.72125391    07\n"
+        session = Mock()
+        session.get.return_value = Mock(status_code=200, text=tle_text)
+        with tempfile.TemporaryDirectory() as data_dir:
+            calculator = self._separate_calculator()
+            calculator.loader = MagicMock()
+            calculator.loader.path_to.side_effect = lambda filename: os.path.join(data_dir, filename)
+            with patch.object(TargetCalculator, '_get_http_session', return_value=session):
+                self.assertEqual(calculator._fetch_tle_text("https://example.invalid/tle", "test.tle", 5.0), tle_text)
+                self.assertEqual(calculator._fetch_tle_text("https://example.invalid/tle", "test.tle", 5.0), tle_text)
+            
+            session.get.assert_called_once()
+            self.assertEqual(os.listdir(data_dir), ["test.tle"])
+            with open(os.path.join(data_dir, "test.tle")) as f:
+                self.assertEqual(f.read(), tle_text)
+    
+    def test_satellite_position_none_when_propagation_fails(self):
+        """Test a loaded satellite whose propagation fails gives None rather than NaN."""
+        calculator = self._separate_calculator()
+        calculator.skyfield_available = True
+        calculator.satellites['99999'] = Mock()
+        calculator._index_satellite_name("DECAYED SAT", '99999')
+        calculator._altaz_cache = Mock(return_value=(math.nan, math.nan))
+        self.assertIsNone(calculator.get_satellite_position('99999'))
+        self.assertIsNone(calculator.get_satellite_position("DECAYED SAT"))
+        
+        calculator._altaz_cache.return_value = (123.0, 45.0)
+        self.assertEqual(calculator.get_satellite_position('99999'), (123.0, 45.0))
+    
+    def test_update_location_refreshes_latitude_terms(self):
+        """Test the cached latitude trig terms follow location updates."""
+        test_date = datetime(2024, 1, 1, 6, 0, 0)
+        # Own instance, since the shared calculator's location must stay fixed
+        calculator = self._separate_calculator()
+        calculator.update_location(-33.8688, 151.2093)
+        self.assertAlmostEqual(calculator._sin_lat, math.sin(math.radians(-33.8688)))
+        self.assertAlmostEqual(calculator._cos_lat, math.cos(math.radians(-33.8688)))
+        
+        # Polaris stays below the horizon from the southern hemisphere
+        _, elevation = calculator.calculate_azimuth_elevation(2.530, 89.264, test_date)
+        self.assertLess(elevation, 0)
+    
+    @unittest.skipUnless(os.environ.get("NUMBA_REQUIRED"), "set NUMBA_REQUIRED=1 where numba must be installed")
+    def test_compiled_kernels_available(self):
+        """Test the coordinate kernels are JIT-compiled rather than running as plain Python."""
+        self.assertTrue(_kernels.numba_available)
+        self.assertTrue(hasattr(_kernels.radec_to_azel, 'py_func'))
+        self.assertTrue(hasattr(_kernels.radec_to_azel_batch, 'py_func'))
+    
+    @unittest.skipUnless(_kernels.gpu_available(), "cupy or a CUDA device is not available")
+    def test_gpu_batch_matches_cpu(self):
+        """Test the GPU array conversion matches the CPU kernel."""
+        rng = np.random.default_rng(2)
+        ra_rad = rng.uniform(0.0, 2 * math.pi, 100000)
+        dec_rad = rng.uniform(-math.pi / 2, math.pi / 2, 100000)
+        sin_lat, cos_lat = self.calculator._sin_lat, self.calculator._cos_lat
+        azimuths = np.empty(ra_rad.size)
+        elevations = np.empty(ra_rad.size)
+        _kernels.radec_to_azel_batch(ra_rad, dec_rad, 1.234, sin_lat, cos_lat, azimuths, elevations)
+        gpu_azimuths, gpu_elevations = _kernels.radec_to_azel_gpu(ra_rad, dec_rad, 1.234, sin_lat, cos_lat)
+        np.testing.assert_allclose(gpu_elevations, elevations, atol=1e-9)
+        # Compare azimuths across the 0/360 wrap
+        np.testing.assert_allclose((gpu_azimuths - azimuths + 180.0) % 360.0 - 180.0, 0.0, atol=1e-9)
+    
+    def test_gpu_dispatch_falls_back_to_cpu(self):
+        """Test large batches stay correct on the CPU when the GPU path is missing or fails."""
+        test_date = datetime(2024, 1, 1, 6, 0, 0)
+        rng = np.random.default_rng(3)
+        ra_hours = rng.uniform(0.0, 24.0, GPU_BATCH_THRESHOLD)
+        dec_degrees = rng.uniform(-89.0, 89.0, GPU_BATCH_THRESHOLD)
+        
+        module = 'celestial_pointer.target_calculator'
+        with patch(f'{module}.gpu_available', return_value=False), \
+                patch(f'{module}.radec_to_azel_gpu') as gpu_kernel:
+            expected = self.calculator.calculate_azimuth_elevation(ra_hours, dec_degrees, test_date)
+            gpu_kernel.assert_not_called()
+        
+        with patch(f'{module}.gpu_available', return_value=True), \
+                patch(f'{module}.radec_to_azel_gpu', side_effect=RuntimeError("no CUDA device")) as gpu_kernel:
+            azimuths, elevations = self.calculator.calculate_azimuth_elevation(ra_hours, dec_degrees, test_date)
+            gpu_kernel.assert_called_once()
+        np.testing.assert_array_equal(azimuths, expected[0])
+        np.testing.assert_array_equal(elevations, expected[1])
+        
+        # Batches below the threshold never try the GPU
+        with patch(f'{module}.gpu_available', return_value=True), \
+                patch(f'{module}.radec_to_azel_gpu') as gpu_kernel:
+            self.calculator.calculate_azimuth_elevation(ra_hours[:100], dec_degrees[:100], test_date)
+            gpu_kernel.assert_not_called()
+    
+    def test_gpu_available_without_cupy(self):
+        """Test the GPU check reports False when cupy cannot be imported."""
+        with patch.dict(sys.modules, {'cupy': None}), \
+                patch.object(_kernels, '_gpu_checked', False), patch.object(_kernels, '_cupy', None):
+            self.assertFalse(_kernels.gpu_available())
+    
+    @unittest.skipUnless(RUN_PERF_TESTS, "set RUN_PERF_TESTS=1 to run timing tests")
+    def test_scalar_microbench(self):
+        """Time 100k scalar azimuth/elevation calls at one site."""
+        test_date = datetime(2024, 1, 1, 6, 0, 0)
+        start = time.perf_counter()
+        for _ in range(100000):
+            self.calculator.calculate_azimuth_elevation(6.752, -16.716, test_date)
+        elapsed = time.perf_counter() - start
+        self.assertLess(elapsed, 10.0, f"100k scalar calls took {elapsed:.2f}s")
+    
+    def test_manual_batch_matches_scalar(self):
+        """Test batched manual azimuth/elevation matches the per-target calculation."""
+        test_date = datetime(2024, 1, 1, 6, 0, 0)
+        ra_hours = np.array([6.752, 2.530, 18.616, 14.261, 0.0])
+        dec_degrees = np.array([-16.716, 89.264, 38.784, 19.182, -89.5])
+        azimuths, elevations = self.calculator._calculate_azimuth_elevation_manual_batch(
+            ra_hours, dec_degrees, test_date)
+        for ra, dec, azimuth, elevation in zip(ra_hours, dec_degrees, azimuths, elevations):
+            expected_az, expected_el = self.calculator._calculate_azimuth_elevation_manual(ra, dec, test_date)
+            self.assertAlmostEqual(elevation, expected_el, places=6)
+            self.assertAlmostEqual((azimuth - expected_az + 180.0) % 360.0 - 180.0, 0.0, places=5)
+    
     def test_julian_day(self):
         """Test Julian Day calculation."""
         test_date = datetime(2024, 1, 1, 12, 0, 0)
         jd = self.calculator._julian_day(test_date)
         self.assertIsInstance(jd, float)
         self.assertGreater(jd, 2400000)  # Should be a reasonable JD
+    
+    def test_julian_day_exact_dates(self):
+        """Test Julian Days of reference dates, including one long before 1970."""
+        self.assertEqual(self.calculator._julian_day(datetime(2000, 1, 1, 12, 0, 0)), 2451545.0)
+        self.assertEqual(self.calculator._julian_day(datetime(1600, 1, 1)), 2305447.5)
+    
+    def test_julian_day_array(self):
+        """Test batched Julian Day calculation."""
+        start = datetime(2024, 1, 1, 0, 0, 0)
+        times = [start + timedelta(seconds=37 * i) for i in range(10000)]
+        jds = self.calculator._julian_day_array(times)
+        self.assertEqual(jds.shape, (10000,))
+        self.assertTrue(np.all(np.diff(jds) > 0))
+        for i in (0, 4321, 9999):
+            self.assertAlmostEqual(jds[i], self.calculator._julian_day(times[i]), places=8)
+    
+    def test_gmst_interp_accuracy(self):
+        """Test table-interpolated GMST against the full polynomial."""
+        jd_grid = self.calculator._gmst_grid[0]
+        jds = np.random.default_rng(0).uniform(jd_grid[0], jd_grid[-1], 1000)
+        exact = _gmst_degrees(jds) % 360.0
+        interpolated = self.calculator._gmst_interp(jds)
+        # Compare across the 0/360 wrap
+        error = (interpolated - exact + 180.0) % 360.0 - 180.0
+        self.assertLess(np.max(np.abs(error)), 1e-6)
+        
+        # The scalar path (used per call by the LST calculation) agrees too
+        for jd in jds[:50]:
+            error = (self.calculator._gmst_interp(float(jd)) - _gmst_degrees(jd) % 360.0 + 180.0) % 360.0 - 180.0
+            self.assertLess(abs(error), 1e-6)
 
 
 if __name__ == '__main__':